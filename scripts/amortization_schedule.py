@@ -9,22 +9,39 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 
 from src.services.deal_service import DealService
-from src.core.calculators.amortization import AmortizationCalculator
+from src.adapters import json_codec
+from src.adapters.deal_cache import DealCache
+from src.core.calculators.amortization import (
+    AmortizationCalculator,
+    TrackScheduleArrays,
+    sum_track_columns,
+)
 
 console = Console()
 
+# (header, style, justify) for every schedule table, per-track and combined
+_SCHEDULE_COLUMNS = (
+    ("Month", "cyan", "right"),
+    ("Payment", None, "right"),
+    ("Interest", "yellow", "right"),
+    ("Principal", "green", "right"),
+    ("Balance", None, "right"),
+    ("Events", "magenta", "left"),
+)
+_SCHEDULE_BOX = box.SIMPLE_HEAVY
+
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -63,6 +80,11 @@ Examples:
         default=None,
         help="Filter to a specific track by name (partial match, case-insensitive).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild the deal instead of using the cache in ~/.cache/real_estate/.",
+    )
     return parser.parse_args()
 
 
@@ -77,6 +99,14 @@ def parse_month_range(months_str: str):
     raise ValueError(f"Invalid month range: {months_str}")
 
 
+def new_schedule_table() -> Table:
+    """Create an empty schedule table with the standard columns."""
+    table = Table(box=_SCHEDULE_BOX, show_header=True)
+    for name, style, justify in _SCHEDULE_COLUMNS:
+        table.add_column(name, style=style, justify=justify)
+    return table
+
+
 def main():
     args = parse_args()
     deal_path = Path(args.deal)
@@ -85,17 +115,32 @@ def main():
         console.print(f"[red]File not found: {deal_path}[/red]")
         sys.exit(1)
 
-    with open(deal_path) as f:
-        cfg = json.load(f)
+    raw = deal_path.read_bytes()
+    cfg = json_codec.loads(raw)
 
-    ds = DealService()
-    deal = ds.create_deal_from_config(cfg)
-    deal.financing.calculate_loan_details(deal.property.purchase_price)
+    cache = DealCache()
+    cache_key = cache.key_for(raw)
+    deal = None if args.no_cache else cache.load(cache_key)
+    if deal is None:
+        ds = DealService()
+        deal = ds.create_deal_from_config(cfg)
+        deal.financing.calculate_loan_details(deal.property.purchase_price)
+        if not args.no_cache:
+            cache.save(cache_key, deal)
 
     if not deal.financing.sub_loans:
         console.print("[red]No Israeli mortgage tracks found in this deal.[/red]")
         sys.exit(1)
 
+    # Render the whole report into one buffer and write it in a single call
+    with console.capture() as capture:
+        print_report(args, cfg, deal, deal_path)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
+
+def print_report(args, cfg: dict, deal, deal_path: Path):
+    """Print the per-track and combined schedule tables for a deal."""
     month_start, month_end = None, None
     if args.months:
         month_start, month_end = parse_month_range(args.months)
@@ -107,20 +152,21 @@ def main():
     ))
 
     def make_schedule_table(title: str, sched, title_style: str = "bold cyan") -> tuple:
-        """Build a Rich table from a schedule. Returns (table, rows_shown, total_p, total_i)."""
-        sl_table = Table(box=box.SIMPLE_HEAVY, show_header=True)
-        sl_table.add_column("Month", style="cyan", justify="right")
-        sl_table.add_column("Payment", justify="right")
-        sl_table.add_column("Interest", justify="right", style="yellow")
-        sl_table.add_column("Principal", justify="right", style="green")
-        sl_table.add_column("Balance", justify="right")
-        sl_table.add_column("Events", style="magenta")
+        """Build a Rich table from a track's schedule arrays.
+
+        Returns (table, rows_shown, total_p, total_i). Payment records are only
+        built for the months inside the --months window.
+        """
+        sl_table = new_schedule_table()
+
+        if month_start is not None:
+            visible = sched.to_payments(month_start, month_end)
+        else:
+            visible = sched.to_payments()
 
         rows_shown = 0
-        for p in sched:
+        for p in visible:
             m = p.payment_number
-            if month_start is not None and not (month_start <= m <= month_end):
-                continue
             if args.events_only and not p.events:
                 continue
             sl_table.add_row(
@@ -133,21 +179,20 @@ def main():
             )
             rows_shown += 1
 
-        total_p = sum(p.principal_payment for p in sched)
-        total_i = sum(p.interest_payment for p in sched)
+        total_p = float(sched.principal_payment.sum())
+        total_i = float(sched.interest_payment.sum())
         return sl_table, rows_shown, total_p, total_i
 
     # --- Collect all schedules (respecting --track filter) ---
-    all_schedules: dict[str, list] = {}
+    all_schedules: dict[str, TrackScheduleArrays] = {}
 
     for sl in deal.financing.sub_loans:
         if args.track and args.track.lower() not in sl.name.lower():
             continue
 
-        sched = AmortizationCalculator.generate_track_schedule(sl)
+        sched = AmortizationCalculator.generate_track_arrays(sl)
         all_schedules[sl.name] = sched
 
-        sl.calculate_effective_rate()
         grace_str = (
             f"  Grace: {sl.grace_period.duration_months}m {sl.grace_period.grace_type.value}"
             if sl.grace_period else ""
@@ -163,7 +208,7 @@ def main():
 
         console.print(
             f"\n[bold cyan]{sl.name}[/bold cyan]  "
-            f"[dim]{sl.track_type.value} | {sl.effective_interest_rate:.2f}% | "
+            f"[dim]{sl.track_type.value} | {sl.calculate_effective_rate():.2f}% | "
             f"{sl.loan_amount:,.0f} | {sl.loan_term_months}m | {sl.repayment_method.value}"
             f"{grace_str}{rc_str}{pp_str}[/dim]"
         )
@@ -171,7 +216,7 @@ def main():
         tbl, rows_shown, total_p, total_i = make_schedule_table(sl.name, sched)
         console.print(tbl)
         console.print(
-            f"  [dim]Total months: {len(sched)} | "
+            f"  [dim]Total months: {sched.num_payments} | "
             f"Principal repaid: {total_p:,.2f} | "
             f"Total interest: {total_i:,.2f}[/dim]"
         )
@@ -180,44 +225,46 @@ def main():
 
     # --- Combined summary table (only when there are multiple tracks) ---
     if len(all_schedules) > 1:
-        max_month = max(p.payment_number for sched in all_schedules.values() for p in sched)
-        track_maps = {
-            name: {p.payment_number: p for p in sched}
-            for name, sched in all_schedules.items()
-        }
+        max_month = max(sched.num_payments for sched in all_schedules.values())
+
+        total_pay, total_int, total_pri, total_bal = sum_track_columns(
+            list(all_schedules.values()),
+            ("payment_amount", "interest_payment", "principal_payment", "ending_balance"),
+            max_month,
+        ).T
+
+        # Events are sparse: only visit the months that have any
+        month_events: dict[int, list[str]] = {}
+        for track_name, sched in all_schedules.items():
+            for m, track_events in sched.events.items():
+                month_events.setdefault(m, []).extend(
+                    f"{track_name}: {e}" for e in track_events
+                )
+
+        active = (total_pay > 0) | (total_bal > 0)
+
+        # With --events-only, quiet months are never displayed: only build
+        # rows for months where some track has an event.
+        if args.events_only:
+            row_months = [m for m in sorted(month_events) if active[m - 1]]
+        else:
+            row_months = (np.flatnonzero(active) + 1).tolist()
 
         combined: list[dict] = []
-        for m in range(1, max_month + 1):
-            total_pay = total_int = total_pri = total_bal = 0.0
-            events: list[str] = []
-            for track_name, pmap in track_maps.items():
-                p = pmap.get(m)
-                if p:
-                    total_pay += p.payment_amount
-                    total_int += p.interest_payment
-                    total_pri += p.principal_payment
-                    total_bal += p.ending_balance
-                    for e in p.events:
-                        events.append(f"{track_name}: {e}")
-            if total_pay > 0 or total_bal > 0:
-                combined.append({
-                    "month": m,
-                    "payment": round(total_pay, 2),
-                    "interest": round(total_int, 2),
-                    "principal": round(total_pri, 2),
-                    "balance": round(total_bal, 2),
-                    "events": events,
-                })
+        for m in row_months:
+            i = m - 1
+            combined.append({
+                "month": m,
+                "payment": round(float(total_pay[i]), 2),
+                "interest": round(float(total_int[i]), 2),
+                "principal": round(float(total_pri[i]), 2),
+                "balance": round(float(total_bal[i]), 2),
+                "events": month_events.get(m, []),
+            })
 
         console.print(f"\n[bold white on blue] COMBINED – All Tracks [/bold white on blue]")
 
-        comb_table = Table(box=box.SIMPLE_HEAVY, show_header=True)
-        comb_table.add_column("Month", style="cyan", justify="right")
-        comb_table.add_column("Payment", justify="right")
-        comb_table.add_column("Interest", justify="right", style="yellow")
-        comb_table.add_column("Principal", justify="right", style="green")
-        comb_table.add_column("Balance", justify="right")
-        comb_table.add_column("Events", style="magenta")
+        comb_table = new_schedule_table()
 
         rows_shown = 0
         for row in combined:
@@ -238,8 +285,8 @@ def main():
 
         console.print(comb_table)
 
-        grand_p = sum(r["principal"] for r in combined)
-        grand_i = sum(r["interest"]  for r in combined)
+        grand_p = sum(round(x, 2) for x in total_pri[active].tolist())
+        grand_i = sum(round(x, 2) for x in total_int[active].tolist())
         console.print(
             f"  [dim]Total months: {max_month} | "
             f"Total principal: {grand_p:,.2f} | "
@@ -8,7 +8,6 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -21,6 +20,8 @@ from rich.panel import Panel
 from rich import box
 
 from src.services.deal_service import DealService
+from src.adapters import json_codec
+from src.adapters.deal_cache import DealCache
 
 console = Console()
 
@@ -44,6 +45,11 @@ Examples:
         metavar="YEARS",
         help="Holding period in years (default: 10)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild the deal instead of using the cache in ~/.cache/real_estate/.",
+    )
     return parser.parse_args()
 
 
@@ -55,12 +61,18 @@ def main():
         console.print(f"[red]File not found: {deal_path}[/red]")
         sys.exit(1)
 
-    with open(deal_path) as f:
-        cfg = json.load(f)
+    raw = deal_path.read_bytes()
+    cfg = json_codec.loads(raw)
 
     ds = DealService()
-    deal = ds.create_deal_from_config(cfg)
-    deal.financing.calculate_loan_details(deal.property.purchase_price)
+    cache = DealCache()
+    cache_key = cache.key_for(raw)
+    deal = None if args.no_cache else cache.load(cache_key)
+    if deal is None:
+        deal = ds.create_deal_from_config(cfg)
+        deal.financing.calculate_loan_details(deal.property.purchase_price)
+        if not args.no_cache:
+            cache.save(cache_key, deal)
 
     console.print(Panel.fit(
         f"[bold blue]{deal.deal_name}[/bold blue]\n"
@@ -81,7 +93,6 @@ def main():
     fin_table.add_column("Events")
 
     for sl in deal.financing.sub_loans:
-        sl.calculate_effective_rate()
         grace_str = (
             f"{sl.grace_period.duration_months}m {sl.grace_period.grace_type.value}"
             if sl.grace_period else "–"
@@ -95,7 +106,7 @@ def main():
             sl.name,
             sl.track_type.value,
             f"{sl.loan_amount:,.0f}",
-            f"{sl.effective_interest_rate:.2f}%",
+            f"{sl.calculate_effective_rate():.2f}%",
             f"{sl.loan_term_months}m",
             sl.repayment_method.value,
             grace_str,
@@ -7,20 +7,32 @@ Usage:
     venv/bin/python3 scripts/export_schedule_csv.py deals/test_deals/01_spitzer_baseline.json
     venv/bin/python3 scripts/export_schedule_csv.py deals/itzhak_navon_21.json --output-dir /tmp/schedules
     venv/bin/python3 scripts/export_schedule_csv.py deals/test_deals/05_two_tracks_spitzer_equal.json --combined
+    venv/bin/python3 scripts/export_schedule_csv.py deals/itzhak_navon_21.json --format parquet
 """
 
 import argparse
 import csv
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rich.console import Console
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; only --format parquet needs it
+    pa = pq = None
+
 from src.services.deal_service import DealService
-from src.core.calculators.amortization import AmortizationCalculator
+from src.adapters import json_codec
+from src.core.calculators.amortization import (
+    AmortizationCalculator,
+    _round_cents,
+    sum_track_columns,
+)
 
 console = Console()
 
@@ -42,6 +54,9 @@ Examples:
 
   # Specific track only
   venv/bin/python3 scripts/export_schedule_csv.py deals/test_deals/05_two_tracks_spitzer_equal.json --track "Track A"
+
+  # Parquet instead of CSV (requires pyarrow)
+  venv/bin/python3 scripts/export_schedule_csv.py deals/itzhak_navon_21.json --combined --format parquet
         """,
     )
     parser.add_argument("deal", help="Path to deal JSON file")
@@ -62,34 +77,158 @@ Examples:
         default=None,
         help="Export only this track (partial match, case-insensitive).",
     )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Output file format (default: csv). Parquet requires pyarrow.",
+    )
     return parser.parse_args()
 
 
 COLUMNS = ["Month", "Year", "Payment", "Interest", "Principal", "Balance", "Events"]
 
 
+# Tuple positions of the COLUMNS used when summarizing rows
+MONTH, EVENTS = 0, 6
+
+# Large enough to hold a whole schedule, so each file is flushed once on close
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Pre-formatted row matching csv.writer's output for unquoted fields
+# (ints as-is, floats via repr, "\r\n" line endings)
+ROW_FORMAT = "%d,%d,%r,%r,%r,%r,%s\r\n"
+
+# Characters that make csv.writer quote a field
+QUOTE_CHARS = frozenset(',"\r\n')
+
+
 def write_csv(path: Path, rows):
+    """Write COLUMNS-ordered row tuples to a CSV file.
+
+    Rows are formatted directly as strings; only rows whose Events text needs
+    quoting go through csv.writer, so the file is identical either way.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
+    with open(path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        write = f.write
+        for row in rows:
+            if QUOTE_CHARS.isdisjoint(row[EVENTS]):
+                write(ROW_FORMAT % row)
+            else:
+                writer.writerow(row)
     return path
 
 
-def schedule_to_rows(sched):
-    return [
+def write_parquet(path: Path, rows):
+    """Write COLUMNS-ordered row tuples to a Snappy-compressed Parquet file.
+
+    Events is dictionary-encoded; it is empty for most months.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = list(rows)
+    columns = zip(*rows) if rows else [()] * len(COLUMNS)
+    types = {"Month": pa.int64(), "Year": pa.int64(), "Events": pa.string()}
+    table = pa.table(
         {
-            "Month": p.payment_number,
-            "Year": p.year,
-            "Payment": round(p.payment_amount, 2),
-            "Interest": round(p.interest_payment, 2),
-            "Principal": round(p.principal_payment, 2),
-            "Balance": round(p.ending_balance, 2),
-            "Events": " | ".join(p.events) if p.events else "",
+            name: pa.array(values, type=types.get(name, pa.float64()))
+            for name, values in zip(COLUMNS, columns)
         }
-        for p in sched
-    ]
+    )
+    pq.write_table(table, path, compression="snappy", use_dictionary=["Events"])
+    return path
+
+
+# --format choice -> (file suffix, writer)
+WRITERS = {
+    "csv": (".csv", write_csv),
+    "parquet": (".parquet", write_parquet),
+}
+
+
+def schedule_to_rows(sched, totals: dict) -> list[tuple]:
+    """Convert payment records into COLUMNS-ordered row tuples.
+
+    The principal and interest totals and the months carrying events are
+    gathered into ``totals`` in the same pass.
+    """
+    rows = []
+    total_p = total_i = 0
+    event_months = []
+    for p in sched:
+        interest = round(p.interest_payment, 2)
+        principal = round(p.principal_payment, 2)
+        total_p += principal
+        total_i += interest
+        events = " | ".join(p.events) if p.events else ""
+        if events:
+            event_months.append(p.payment_number)
+        rows.append(
+            (
+                p.payment_number,
+                p.year,
+                round(p.payment_amount, 2),
+                interest,
+                principal,
+                round(p.ending_balance, 2),
+                events,
+            )
+        )
+    totals["principal"] = total_p
+    totals["interest"] = total_i
+    totals["event_months"] = event_months
+    return rows
+
+
+def iter_combined_rows(track_arrays: dict, max_month: int, totals: dict):
+    """Yield combined CSV rows (all tracks summed) one month at a time.
+
+    Rows are streamed straight into the CSV writer rather than collected in
+    a list; the principal and interest totals are accumulated into
+    ``totals`` as rows are produced.
+    """
+    month_events: dict[int, list[str]] = {}
+    for track_name, arrays in track_arrays.items():
+        for m, events in arrays.events.items():
+            month_events.setdefault(m, []).append(f"{track_name}: {' | '.join(events)}")
+
+    sums = sum_track_columns(
+        list(track_arrays.values()),
+        ("payment_amount", "interest_payment", "principal_payment", "ending_balance"),
+        max_month,
+    )
+    totals["principal"] = totals["interest"] = 0
+    for m, month_sums in enumerate(_round_cents(sums), start=1):
+        pay, intr, prin, bal = month_sums.tolist()
+        totals["principal"] += prin
+        totals["interest"] += intr
+        yield (
+            m,
+            (m - 1) // 12 + 1,
+            pay,
+            intr,
+            prin,
+            bal,
+            " | ".join(month_events.get(m, [])),
+        )
+
+
+def export_track(sl, out_dir: Path, fmt: str = "csv"):
+    """Build one track's schedule and write it out in the given format.
+
+    Returns (arrays, rows, written path, totals) for the summary and the
+    combined export.
+    """
+    arrays = AmortizationCalculator.generate_track_arrays(sl)
+    totals: dict = {}
+    rows = schedule_to_rows(arrays.to_payments(), totals)
+
+    suffix, writer = WRITERS[fmt]
+    safe_name = sl.name.replace(" ", "_").replace("/", "-")
+    written = writer(out_dir / f"{safe_name}{suffix}", rows)
+    return arrays, rows, written, totals
 
 
 def main():
@@ -100,8 +239,13 @@ def main():
         console.print(f"[red]File not found: {deal_path}[/red]")
         sys.exit(1)
 
-    with open(deal_path) as f:
-        cfg = json.load(f)
+    if args.format == "parquet" and pa is None:
+        console.print(
+            "[red]--format parquet requires pyarrow (pip install pyarrow).[/red]"
+        )
+        sys.exit(1)
+
+    cfg = json_codec.read_json(deal_path)
 
     ds = DealService()
     deal = ds.create_deal_from_config(cfg)
@@ -118,22 +262,25 @@ def main():
     console.print(f"\n[bold]{deal_name}[/bold]  [dim]{deal_path}[/dim]")
 
     all_schedules = {}
+    track_arrays = {}
 
-    for sl in deal.financing.sub_loans:
-        if args.track and args.track.lower() not in sl.name.lower():
-            continue
+    sub_loans = [
+        sl for sl in deal.financing.sub_loans
+        if not args.track or args.track.lower() in sl.name.lower()
+    ]
 
-        sched = AmortizationCalculator.generate_track_schedule(sl)
-        rows = schedule_to_rows(sched)
-        all_schedules[sl.name] = rows
+    # Tracks are independent; file writes overlap across threads. map()
+    # keeps results (and the printed summary) in sub-loan order.
+    with ThreadPoolExecutor(max_workers=max(len(sub_loans), 1)) as ex:
+        results = list(ex.map(lambda sl: export_track(sl, out_dir, args.format), sub_loans))
 
-        safe_name = sl.name.replace(" ", "_").replace("/", "-")
-        csv_path = out_dir / f"{safe_name}.csv"
-        written = write_csv(csv_path, rows)
+    for sl, (arrays, rows, written, track_totals) in zip(sub_loans, results):
+        all_schedules[sl.name] = rows
+        track_arrays[sl.name] = arrays
 
-        total_p = sum(r["Principal"] for r in rows)
-        total_i = sum(r["Interest"]  for r in rows)
-        event_months = [r["Month"] for r in rows if r["Events"]]
+        total_p = track_totals["principal"]
+        total_i = track_totals["interest"]
+        event_months = track_totals["event_months"]
 
         console.print(
             f"  [green]✓[/green] [cyan]{sl.name}[/cyan]  →  {written}\n"
@@ -145,35 +292,18 @@ def main():
 
     # Combined CSV
     if args.combined and len(all_schedules) > 1:
-        max_month = max(r["Month"] for rows in all_schedules.values() for r in rows)
-        combined_rows = []
-        for m in range(1, max_month + 1):
-            total = {"Month": m, "Year": (m - 1) // 12 + 1,
-                     "Payment": 0.0, "Interest": 0.0, "Principal": 0.0,
-                     "Balance": 0.0, "Events": ""}
-            events = []
-            for track_name, rows in all_schedules.items():
-                row_map = {r["Month"]: r for r in rows}
-                if m in row_map:
-                    r = row_map[m]
-                    total["Payment"]   += r["Payment"]
-                    total["Interest"]  += r["Interest"]
-                    total["Principal"] += r["Principal"]
-                    total["Balance"]   += r["Balance"]
-                    if r["Events"]:
-                        events.append(f"{track_name}: {r['Events']}")
-
-            total["Payment"]   = round(total["Payment"],   2)
-            total["Interest"]  = round(total["Interest"],  2)
-            total["Principal"] = round(total["Principal"], 2)
-            total["Balance"]   = round(total["Balance"],   2)
-            total["Events"]    = " | ".join(events)
-            combined_rows.append(total)
-
-        combined_path = out_dir / "combined.csv"
-        write_csv(combined_path, combined_rows)
-        total_p = sum(r["Principal"] for r in combined_rows)
-        total_i = sum(r["Interest"]  for r in combined_rows)
+        # Schedules are in payment order, so each track's last row is its max month
+        assert all(
+            rows[-1][MONTH] == len(rows) for rows in all_schedules.values() if rows
+        ), "track schedules must be contiguous and ordered by month"
+        max_month = max(rows[-1][MONTH] for rows in all_schedules.values() if rows)
+        combined_totals: dict = {}
+
+        suffix, writer = WRITERS[args.format]
+        combined_path = out_dir / f"combined{suffix}"
+        writer(combined_path, iter_combined_rows(track_arrays, max_month, combined_totals))
+        total_p = combined_totals["principal"]
+        total_i = combined_totals["interest"]
         console.print(
             f"  [green]✓[/green] [bold]Combined[/bold]  →  {combined_path}\n"
             f"    [dim]Total principal: {total_p:,.2f} | Total interest: {total_i:,.2f}[/dim]"
@@ -31,14 +31,17 @@ from .core.models import (
     MetricType,
 )
 
-from .core.calculators import (
-    Calculator,
-    CalculatorResult,
-    AmortizationCalculator,
-    CashFlowCalculator,
-    MetricsCalculator,
-    ProFormaCalculator,
-)
+from ._lazy import lazy_exports
+
+# Calculators load on first access so importing the models stays light
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    "Calculator": ".core.calculators",
+    "CalculatorResult": ".core.calculators",
+    "AmortizationCalculator": ".core.calculators",
+    "CashFlowCalculator": ".core.calculators",
+    "MetricsCalculator": ".core.calculators",
+    "ProFormaCalculator": ".core.calculators",
+})
 
 # Version
 __version__ = "2.0.0"
@@ -0,0 +1,32 @@
+"""Lazy package exports (PEP 562 module ``__getattr__``/``__dir__``)."""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, namespace: Dict[str, Any], exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package's lazy exports.
+
+    Args:
+        package: The package's ``__name__`` (relative modules resolve against it)
+        namespace: The package's ``globals()``; loaded values are cached here
+        exports: Exported name -> module that defines it
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,10 +1,12 @@
 """Adapters for external interfaces and persistence."""
 
 from .config_loader import ConfigLoader, get_config_value
+from .deal_cache import DealCache
 from .repository import DealRepository
 
 __all__ = [
     "ConfigLoader",
     "get_config_value",
+    "DealCache",
     "DealRepository",
 ]
@@ -1,8 +1,12 @@
 """Configuration loader for deal configurations."""
 
-import json
+import copy
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import json_codec
+from .repository import JsonFileRepository
 
 
 def get_config_value(config_dict: Optional[Dict], key_path: str, default: Any = None) -> Any:
@@ -41,17 +45,42 @@ class ConfigLoader:
         """
         self.config_dir = config_dir or Path.cwd() / "deals"
         self._config_files: Dict[str, Path] = {}
+        # path -> (st_mtime_ns, parsed config); unchanged files skip re-parsing
+        self._parse_cache: Dict[Path, Tuple[int, Dict]] = {}
+        # Directory st_mtime_ns at the last scan; None forces a rescan
+        self._dir_mtime_ns: Optional[int] = None
         self._refresh_config_list()
 
     def _refresh_config_list(self) -> None:
         """Scan config directory for JSON configuration files."""
-        self._config_files = {}
-        
-        # Look for JSON files in the config directory
-        for json_file in self.config_dir.glob("*.json"):
-            # Use filename without extension as the config name
-            name = json_file.stem.replace("_", " ").title()
-            self._config_files[name] = json_file
+        try:
+            dir_mtime = os.stat(self.config_dir).st_mtime_ns
+        except OSError:
+            self._config_files = {}
+            self._dir_mtime_ns = None
+            return
+
+        # Adding, removing or renaming a file bumps the directory mtime
+        if dir_mtime == self._dir_mtime_ns:
+            return
+
+        config_files: Dict[str, Path] = {}
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                # Skip the deal repository's sidecar index
+                if (
+                    not entry.name.endswith(".json")
+                    or entry.name == JsonFileRepository.INDEX_FILENAME
+                    or not entry.is_file()
+                ):
+                    continue
+                json_file = Path(entry.path)
+                # Use filename without extension as the config name
+                name = json_file.stem.replace("_", " ").title()
+                config_files[name] = json_file
+
+        self._config_files = config_files
+        self._dir_mtime_ns = dir_mtime
 
     def list_available_configs(self) -> List[str]:
         """List available configuration names.
@@ -87,11 +116,19 @@ class ConfigLoader:
                 return None
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            mtime_ns = config_path.stat().st_mtime_ns
+            cached = self._parse_cache.get(config_path)
+            if cached is not None and cached[0] == mtime_ns:
+                # Callers may mutate the config, so never hand out the cached dict
+                return copy.deepcopy(cached[1])
+
+            config = json_codec.read_json(config_path)
+        except (json_codec.JSONDecodeError, IOError) as e:
             raise ConfigLoadError(f"Error loading configuration '{config_name}': {e}")
 
+        self._parse_cache[config_path] = (mtime_ns, config)
+        return copy.deepcopy(config)
+
     def save_configuration(self, config_name: str, config_data: Dict) -> Path:
         """Save a configuration to a file.
         
@@ -105,9 +142,10 @@ class ConfigLoader:
         filename = config_name.lower().replace(" ", "_") + ".json"
         config_path = self.config_dir / filename
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2)
+        json_codec.write_json(config_path, config_data)
 
+        # The write may land within the directory's mtime granularity
+        self._dir_mtime_ns = None
         self._refresh_config_list()
         return config_path
 
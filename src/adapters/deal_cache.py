@@ -0,0 +1,126 @@
+"""On-disk cache of built Deal objects, keyed by the source JSON."""
+
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+import pydantic
+
+from .. import __version__
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "real_estate"
+
+# Source files whose changes invalidate cached deals (everything a pickled
+# Deal can reference, plus the config -> Deal builder).
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent
+_FINGERPRINT_SOURCES = (
+    _SOURCE_ROOT / "core",
+    _SOURCE_ROOT / "services" / "deal_service.py",
+)
+
+
+def _code_fingerprint() -> str:
+    """Fingerprint of the code that builds a Deal.
+
+    Covers the package, interpreter, pickle protocol and pydantic versions
+    and the path, size and mtime of every source file, so adding, removing
+    or editing any of them changes it.
+    """
+    digest = hashlib.sha256(__version__.encode())
+    digest.update(
+        f"{sys.version_info}:{pickle.HIGHEST_PROTOCOL}:{pydantic.VERSION}\n".encode()
+    )
+    for source in _FINGERPRINT_SOURCES:
+        paths = sorted(source.rglob("*.py")) if source.is_dir() else [source]
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            relative = path.relative_to(_SOURCE_ROOT).as_posix()
+            digest.update(f"{relative}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class DealCache:
+    """Pickle cache for Deal objects built from JSON deal files.
+
+    Entries are keyed by a SHA-256 of the raw file bytes plus a fingerprint
+    of the code that builds the deal, so editing either the deal file or
+    that code invalidates the entry. Unreadable or unwritable cache files
+    count as misses. Only the MAX_ENTRIES most recently used entries are
+    kept; older ones are deleted when a new entry is saved.
+    """
+
+    MAX_ENTRIES = 64
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files. Defaults to ~/.cache/real_estate/
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+
+    def key_for(self, raw: bytes) -> str:
+        """Build the cache key for the raw bytes of a deal file."""
+        digest = hashlib.sha256(raw)
+        digest.update(_code_fingerprint().encode())
+        return digest.hexdigest()
+
+    def _get_file_path(self, key: str) -> Path:
+        """Get the cache file path for a key."""
+        return self.cache_dir / f"deal-{key}.pkl"
+
+    def load(self, key: str) -> Optional[Any]:
+        """Load a cached deal, or None on a miss or unreadable entry.
+
+        Any error while unpickling (a truncated file, a newer protocol, a
+        class that no longer exists, ...) is treated as a miss.
+        """
+        file_path = self._get_file_path(key)
+        try:
+            with open(file_path, "rb") as f:
+                deal = pickle.load(f)
+        except Exception:
+            return None
+        try:
+            os.utime(file_path)  # mark as recently used for pruning
+        except OSError:
+            pass
+        return deal
+
+    def save(self, key: str, deal: Any) -> None:
+        """Store a deal in the cache (best effort)."""
+        file_path = self._get_file_path(key)
+        tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(deal, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, file_path)
+        except (OSError, pickle.PicklingError):
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete all but the MAX_ENTRIES most recently used entries."""
+        entries = []
+        for path in self.cache_dir.glob("deal-*.pkl"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+        for _, path in entries[self.MAX_ENTRIES:]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,117 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+
+import json
+import math
+import os
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is the fallback
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses this
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    orjson rejects the ``NaN`` and ``Infinity`` literals that older files
+    written by the stdlib encoder may contain, so documents it cannot
+    parse are retried with the stdlib parser, which accepts them.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize data as UTF-8 JSON bytes indented by two spaces.
+
+    JSON has no literal for non-finite floats, so NaN and +/-Infinity are
+    written as ``null`` whichever encoder is used.
+
+    Args:
+        data: Value to serialize
+        default: Fallback converter for types the encoder does not support
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=default,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        _finite_or_null(data),
+        indent=2,
+        ensure_ascii=False,
+        allow_nan=False,
+        default=_stdlib_default(default),
+    ).encode("utf-8")
+
+
+def _finite_or_null(obj: Any) -> Any:
+    """Copy of ``obj`` with non-finite floats replaced by None, as orjson does."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_null(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_null(value) for value in obj]
+    return obj
+
+
+def _stdlib_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Extend ``default`` with the types orjson serializes natively.
+
+    Dates and times become ISO 8601 strings and NumPy values become lists
+    or scalars (with non-finite floats as None), matching orjson's output.
+    """
+    def convert(obj: Any) -> Any:
+        if isinstance(obj, (datetime, date, time)):
+            return obj.isoformat()
+        if isinstance(obj, np.ndarray):
+            return _finite_or_null(obj.tolist())
+        if isinstance(obj, np.generic):
+            return _finite_or_null(obj.item())
+        if default is not None:
+            return _finite_or_null(default(obj))
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    return convert
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def write_json(
+    path: Path, data: Any, default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """Serialize data and atomically replace a JSON file with it.
+
+    The bytes go to a temporary sibling file that is then renamed over the
+    target, so readers never see a partially written file.
+    """
+    path = Path(path)
+    payload = dumps(data, default=default)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
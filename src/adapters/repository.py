@@ -1,11 +1,13 @@
 """Deal repository for persistence operations."""
 
-import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from . import json_codec
+
 
 class DealRepository(ABC):
     """Abstract base class for deal persistence."""
@@ -37,7 +39,14 @@ class DealRepository(ABC):
 
 
 class JsonFileRepository(DealRepository):
-    """File-based JSON repository for deal persistence."""
+    """File-based JSON repository for deal persistence.
+
+    A sidecar index file maps each deal filename to its (st_mtime_ns,
+    deal_id), so listing deals only parses files added or edited outside
+    the repository.
+    """
+
+    INDEX_FILENAME = "_index.json"
 
     def __init__(self, storage_dir: Optional[Path] = None):
         """Initialize the repository.
@@ -47,6 +56,7 @@ class JsonFileRepository(DealRepository):
         """
         self.storage_dir = storage_dir or Path.cwd() / "deals"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.storage_dir / self.INDEX_FILENAME
 
     def _get_file_path(self, deal_id: str) -> Path:
         """Get the file path for a deal ID."""
@@ -54,6 +64,37 @@ class JsonFileRepository(DealRepository):
         safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in deal_id)
         return self.storage_dir / f"{safe_id}.json"
 
+    def _read_index(self) -> Optional[Dict[str, Tuple[int, str]]]:
+        """Read the sidecar index, or None if it is missing or unreadable."""
+        try:
+            raw = json_codec.read_json(self.index_path)
+            return {
+                name: (int(mtime), deal_id) for name, (mtime, deal_id) in raw.items()
+            }
+        except (json_codec.JSONDecodeError, IOError, AttributeError, TypeError, ValueError):
+            return None
+
+    def _write_index(self, index: Dict[str, Tuple[int, str]]) -> None:
+        """Atomically replace the sidecar index."""
+        payload = {name: list(entry) for name, entry in index.items()}
+        try:
+            json_codec.write_json(self.index_path, payload)
+        except OSError:
+            # The index is only an accelerator; list_all rebuilds it
+            pass
+
+    def _update_index(self, file_path: Path, deal_id: Optional[str]) -> None:
+        """Record (or with deal_id=None, drop) a deal file in the index."""
+        index = self._read_index()
+        if index is None:
+            # No index yet; the next list_all builds it from a full scan
+            return
+        if deal_id is None:
+            index.pop(file_path.name, None)
+        else:
+            index[file_path.name] = (file_path.stat().st_mtime_ns, deal_id)
+        self._write_index(index)
+
     def save(self, deal_id: str, deal_data: Dict) -> None:
         """Save a deal to a JSON file.
         
@@ -73,8 +114,8 @@ class JsonFileRepository(DealRepository):
             **deal_data,
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data_with_meta, f, indent=2, default=str)
+        json_codec.write_json(file_path, data_with_meta, default=str)
+        self._update_index(file_path, deal_id)
 
     def load(self, deal_id: str) -> Optional[Dict]:
         """Load a deal from a JSON file.
@@ -91,12 +132,11 @@ class JsonFileRepository(DealRepository):
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Remove metadata before returning
-                data.pop("_metadata", None)
-                return data
-        except (json.JSONDecodeError, IOError):
+            data = json_codec.read_json(file_path)
+            # Remove metadata before returning
+            data.pop("_metadata", None)
+            return data
+        except (json_codec.JSONDecodeError, IOError):
             return None
 
     def list_all(self) -> List[str]:
@@ -105,18 +145,41 @@ class JsonFileRepository(DealRepository):
         Returns:
             List of deal IDs
         """
-        deal_ids = []
-        for file_path in self.storage_dir.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if "_metadata" in data and "deal_id" in data["_metadata"]:
-                        deal_ids.append(data["_metadata"]["deal_id"])
-                    else:
-                        deal_ids.append(file_path.stem)
-            except (json.JSONDecodeError, IOError):
-                continue
-        return deal_ids
+        index = self._read_index()
+        cached_index = index or {}
+        new_index: Dict[str, Tuple[int, str]] = {}
+
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # The sidecar index is the only non-deal JSON file here
+                if not name.endswith(".json") or name == self.INDEX_FILENAME:
+                    continue
+                if not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+
+                cached = cached_index.get(name)
+                if cached is not None and cached[0] == mtime:
+                    new_index[name] = cached
+                    continue
+
+                try:
+                    data = json_codec.read_json(entry.path)
+                except (json_codec.JSONDecodeError, IOError):
+                    continue
+                if "_metadata" in data and "deal_id" in data["_metadata"]:
+                    deal_id = data["_metadata"]["deal_id"]
+                else:
+                    deal_id = Path(name).stem
+                new_index[name] = (mtime, deal_id)
+
+        if new_index != index:
+            self._write_index(new_index)
+        return [deal_id for _, deal_id in new_index.values()]
 
     def delete(self, deal_id: str) -> bool:
         """Delete a deal from the repository.
@@ -131,6 +194,7 @@ class JsonFileRepository(DealRepository):
 
         if file_path.exists():
             file_path.unlink()
+            self._update_index(file_path, None)
             return True
         return False
 
@@ -1,5 +1,6 @@
 """Scenario analysis for real estate investments."""
 
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -36,6 +37,16 @@ class Scenario(BaseModel):
     # Financing adjustments
     interest_rate_adjustment: float = 0  # Percentage points
 
+    def is_noop(self) -> bool:
+        """Whether this scenario leaves every deal assumption unchanged."""
+        return (
+            self.appreciation_adjustment == 0
+            and self.rent_growth_adjustment == 0
+            and self.expense_growth_adjustment == 0
+            and self.vacancy_rate_multiplier == 1.0
+            and self.interest_rate_adjustment == 0
+        )
+
     @classmethod
     def pessimistic(cls) -> "Scenario":
         """Create a pessimistic scenario."""
@@ -74,8 +85,14 @@ class Scenario(BaseModel):
         )
 
 
-class ScenarioMetrics(BaseModel):
-    """Metrics calculated for a specific scenario."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ScenarioMetrics:
+    """Metrics calculated for a specific scenario.
+
+    A plain dataclass rather than a model: every field is copied from an
+    already-validated MetricsBundle, so construction skips validation.
+    Keyword-only, like the model it replaced.
+    """
     
     scenario: Scenario
     metrics: MetricsBundle
@@ -88,9 +105,6 @@ class ScenarioMetrics(BaseModel):
     noi_year1: float
     cash_flow_year1: float
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
 class ScenarioResult(BaseModel):
     """Result of scenario analysis."""
@@ -152,6 +166,8 @@ class ScenarioAnalyzer:
             deal: The base deal to analyze
         """
         self.base_deal = deal
+        # holding_period -> metrics of the unmodified base deal
+        self._base_metrics: Dict[int, MetricsBundle] = {}
 
     def analyze(
         self,
@@ -175,19 +191,10 @@ class ScenarioAnalyzer:
             ]
 
         scenario_metrics = []
-        
+
         for scenario in scenarios:
-            # Apply scenario adjustments
-            modified_deal = self._apply_scenario(scenario)
-            
-            # Calculate metrics
-            calculator = MetricsCalculator(modified_deal)
-            result = calculator.calculate(
-                holding_period=holding_period,
-            )
-            
-            if result.success:
-                metrics = result.data
+            metrics = self._calculate_scenario_metrics(scenario, holding_period)
+            if metrics is not None:
                 scenario_metrics.append(
                     ScenarioMetrics(
                         scenario=scenario,
@@ -207,6 +214,33 @@ class ScenarioAnalyzer:
             holding_period=holding_period,
         )
 
+    def _calculate_scenario_metrics(
+        self, scenario: Scenario, holding_period: int
+    ) -> Optional[MetricsBundle]:
+        """Calculate metrics for one scenario, or None if the calculation fails.
+
+        No-op scenarios reuse the base deal's metrics, computed once per
+        holding period for the lifetime of the analyzer.
+        """
+        noop = scenario.is_noop()
+        if noop and holding_period in self._base_metrics:
+            return self._base_metrics[holding_period]
+
+        # Apply scenario adjustments
+        modified_deal = self._apply_scenario(scenario)
+
+        # Calculate metrics
+        calculator = MetricsCalculator(modified_deal)
+        result = calculator.calculate(
+            holding_period=holding_period,
+        )
+        if not result.success:
+            return None
+
+        if noop:
+            self._base_metrics[holding_period] = result.data
+        return result.data
+
     def _apply_scenario(self, scenario: Scenario) -> Deal:
         """Apply scenario adjustments to create a modified deal.
         
@@ -216,8 +250,10 @@ class ScenarioAnalyzer:
         Returns:
             Modified Deal object
         """
-        # Deep copy the base deal
-        modified = self.base_deal.model_copy(deep=True)
+        # Copy only the sub-models a scenario touches; property is shared
+        modified = self._copy_deal_with(
+            "market_assumptions", "income", "expenses", "financing"
+        )
 
         # Apply market assumption adjustments
         modified.market_assumptions.annual_appreciation_percent += scenario.appreciation_adjustment
@@ -243,6 +279,22 @@ class ScenarioAnalyzer:
 
         return modified
 
+    def _copy_deal_with(self, *fields: str) -> Deal:
+        """Shallow-copy the base deal, deep-copying only the named sub-models.
+
+        Args:
+            fields: Names of Deal sub-models that the caller will modify
+
+        Returns:
+            Deal sharing every other field with the base deal
+        """
+        return self.base_deal.model_copy(
+            update={
+                name: getattr(self.base_deal, name).model_copy(deep=True)
+                for name in fields
+            }
+        )
+
     def stress_test(
         self,
         max_vacancy_rate: float = 20,
@@ -260,10 +312,13 @@ class ScenarioAnalyzer:
             Dictionary with stress test results
         """
         results = {}
-        
+
+        # One working copy for the whole sweep; only income is modified
+        modified = self._copy_deal_with("income")
+        orig_vacancy = modified.income.vacancy_rate_percent
+
         # Find vacancy rate that causes negative cash flow
         for vacancy in range(0, int(max_vacancy_rate) + 1):
-            modified = self.base_deal.model_copy(deep=True)
             modified.income.vacancy_rate_percent = vacancy
             
             cash_flow = modified.get_year_1_cash_flow()
@@ -272,20 +327,16 @@ class ScenarioAnalyzer:
                 break
         else:
             results["break_even_vacancy"] = max_vacancy_rate
+
+        modified.income.vacancy_rate_percent = orig_vacancy
         
-        # Find expense increase that causes negative cash flow
-        for exp_increase in range(0, int(max_expense_increase) + 1):
-            modified = self.base_deal.model_copy(deep=True)
-            # Increase all expenses by this percentage
-            base_opex = modified.expenses.calculate_total_operating_expenses(
-                modified.income.calculate_effective_gross_income(modified.property.num_units),
-                modified.property.num_units
-            )
-            # This is a simplified stress test - in practice you'd modify individual expenses
-            results["break_even_expense_increase"] = exp_increase
-            
-            if modified.get_year_1_cash_flow() < 0:
-                break
+        # Expense increase that causes negative cash flow. The sweep never
+        # perturbs expenses (it is a simplified test), so every step sees the
+        # base cash flow: it stops at 0 if that is negative, else runs to the max.
+        base_cash_flow = self.base_deal.get_year_1_cash_flow()
+        results["break_even_expense_increase"] = (
+            int(max_expense_increase) if base_cash_flow >= 0 else 0
+        )
         
         # Calculate cushion metrics
         results["current_vacancy"] = self.base_deal.income.vacancy_rate_percent
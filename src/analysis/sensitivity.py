@@ -1,11 +1,17 @@
 """Sensitivity analysis for real estate investments."""
 
-from typing import Dict, List, Tuple, Callable
+from operator import attrgetter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Callable
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 from ..core.models import Deal
 from ..core.calculators import MetricsCalculator, ProFormaCalculator
+from ..core.calculators.base import LRUCache
+
+# Cache miss marker; a failed calculation is cached as None
+_MISSING = object()
 
 
 class SensitivityResult(BaseModel):
@@ -16,8 +22,22 @@ class SensitivityResult(BaseModel):
     variable1_values: List[float]
     variable2_values: List[float]
     metric_name: str
-    metric_grid: List[List[float]]  # 2D grid of metric values
+    metric_grid: np.ndarray  # 2D float grid, variable2 along rows
     base_value: float  # Metric value at base case (0%, 0%)
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @field_validator("metric_grid", mode="before")
+    @classmethod
+    def _coerce_grid(cls, v):
+        """Accept nested lists as well as arrays."""
+        return np.asarray(v, dtype=float)
+
+    @field_serializer("metric_grid")
+    def _serialize_grid(self, grid: np.ndarray) -> List[List[float]]:
+        """Dump the grid as nested lists, as before it was an array."""
+        return grid.tolist()
     
     def to_numpy_grid(self) -> np.ndarray:
         """Convert metric grid to numpy array."""
@@ -25,16 +45,14 @@ class SensitivityResult(BaseModel):
     
     def get_value_at(self, var1_pct: float, var2_pct: float) -> float:
         """Get the metric value at specific percentage changes."""
-        # Find closest indices
-        var1_idx = min(
-            range(len(self.variable1_values)),
-            key=lambda i: abs(self.variable1_values[i] - var1_pct)
-        )
-        var2_idx = min(
-            range(len(self.variable2_values)),
-            key=lambda i: abs(self.variable2_values[i] - var2_pct)
-        )
-        return self.metric_grid[var2_idx][var1_idx]
+        var1_idx = self._closest_index(self.variable1_values, var1_pct)
+        var2_idx = self._closest_index(self.variable2_values, var2_pct)
+        return float(self.metric_grid[var2_idx, var1_idx])
+
+    @staticmethod
+    def _closest_index(values: List[float], target: float) -> int:
+        """Index of the axis value closest to target (first one on ties)."""
+        return int(np.argmin(np.abs(np.asarray(values, dtype=float) - target)))
 
 
 class SensitivityAnalyzer:
@@ -54,6 +72,31 @@ class SensitivityAnalyzer:
         "insurance": ("expenses", "insurance_annual"),
     }
 
+    # Percentage and rate fields take additive changes (pct points) rather
+    # than proportional ones
+    ADDITIVE_VARIABLES = frozenset(
+        name for name, path in VARIABLE_MAP.items()
+        if "percent" in path[-1] or "rate" in path[-1]
+    )
+
+    # Getters for the model that owns each variable's field
+    _FIELD_OWNERS = {
+        name: attrgetter(".".join(path[:-1])) for name, path in VARIABLE_MAP.items()
+    }
+
+    # Variables whose change requires recalculating the loan
+    FINANCING_VARIABLES = ("purchase_price", "down_payment")
+
+    # Full-calculation metric values keyed by (deal JSON, holding period),
+    # shared by all analyzers so repeated requests for a deal reuse them
+    METRICS_CACHE_SIZE = 1024
+    _metrics_cache = LRUCache(METRICS_CACHE_SIZE)
+
+    # Derived financing state that loan recalculation and the calculators
+    # update in place; restored after each overlay
+    FINANCING_STATE_FIELDS = ("loan_amount", "down_payment_amount", "monthly_payment")
+    TRACK_STATE_FIELDS = ("monthly_payment", "cpi_adjusted_principal", "effective_interest_rate")
+
     def __init__(self, deal: Deal):
         """Initialize the analyzer with a base deal.
         
@@ -99,22 +142,17 @@ class SensitivityAnalyzer:
         # Calculate base case value
         base_metric = self._calculate_metric(self.base_deal, target_metric, holding_period)
 
-        # Build the grid
-        metric_grid = []
-        for var2_pct in var2_pcts:
-            row = []
-            for var1_pct in var1_pcts:
-                # Create modified deal
-                modified_deal = self._apply_percentage_change(
-                    variable1, var1_pct, variable2, var2_pct
-                )
-                
-                # Calculate metric
-                metric_value = self._calculate_metric(
-                    modified_deal, target_metric, holding_period
-                )
-                row.append(metric_value)
-            metric_grid.append(row)
+        # Build the grid one modified deal at a time, overlaying each
+        # cell's changes on a single working copy
+        working_deal = self.base_deal.model_copy(deep=True)
+        metric_grid = np.empty((len(var2_pcts), len(var1_pcts)))
+        for i, var2_pct in enumerate(var2_pcts):
+            for j, var1_pct in enumerate(var1_pcts):
+                changes = [(variable1, var1_pct), (variable2, var2_pct)]
+                with self._with_overrides(working_deal, changes) as modified_deal:
+                    metric_grid[i, j] = self._calculate_metric(
+                        modified_deal, target_metric, holding_period
+                    )
 
         return SensitivityResult(
             variable1_name=variable1,
@@ -155,70 +193,79 @@ class SensitivityAnalyzer:
         percentages = np.linspace(range_pct[0], range_pct[1], steps).tolist()
         results = {metric: [] for metric in target_metrics}
 
+        working_deal = self.base_deal.model_copy(deep=True)
         for pct in percentages:
-            # Create modified deal
-            modified_deal = self._apply_percentage_change(variable, pct)
-            
-            for metric in target_metrics:
-                value = self._calculate_metric(modified_deal, metric, holding_period)
-                results[metric].append((pct, value))
+            with self._with_overrides(working_deal, [(variable, pct)]) as modified_deal:
+                for metric in target_metrics:
+                    value = self._calculate_metric(modified_deal, metric, holding_period)
+                    results[metric].append((pct, value))
 
         return results
 
-    def _apply_percentage_change(
-        self,
-        variable1: str,
-        pct1: float,
-        variable2: str = None,
-        pct2: float = None,
-    ) -> Deal:
-        """Create a modified deal with percentage changes applied.
-        
-        Args:
-            variable1: First variable to modify
-            pct1: Percentage change for variable1
-            variable2: Optional second variable to modify
-            pct2: Percentage change for variable2
-            
-        Returns:
-            Modified Deal object
-        """
-        # Deep copy the base deal
-        modified = self.base_deal.model_copy(deep=True)
+    @contextmanager
+    def _with_overrides(
+        self, deal: Deal, changes: List[Tuple[str, float]]
+    ) -> Iterator[Deal]:
+        """Apply percentage changes to ``deal`` in place, undoing them on exit.
 
-        # Apply first change
-        self._set_modified_value(modified, variable1, pct1)
+        Changes are applied in order (as with a fresh copy of the base deal)
+        and the loan is recalculated if price or down payment moved. On exit
+        the changed fields and the derived financing state are restored, so
+        one working copy can stand in for a deep copy per grid cell.
+        """
+        saved: Dict[Tuple[str, ...], float] = {}
+        for variable, _ in changes:
+            path = self.VARIABLE_MAP[variable]
+            saved.setdefault(path, getattr(getattr(deal, path[0]), path[1]))
+        financing_state = self._financing_state(deal)
 
-        # Apply second change if provided
-        if variable2 and pct2 is not None:
-            self._set_modified_value(modified, variable2, pct2)
+        try:
+            for variable, pct in changes:
+                self._set_modified_value(deal, variable, pct)
+            if any(variable in self.FINANCING_VARIABLES for variable, _ in changes):
+                deal.financing.calculate_loan_details(deal.property.purchase_price)
+            yield deal
+        finally:
+            for (component, attr), value in saved.items():
+                setattr(getattr(deal, component), attr, value)
+            self._restore_financing_state(deal, financing_state)
 
-        # Recalculate financing if needed
-        if variable1 in ("purchase_price", "down_payment") or variable2 in ("purchase_price", "down_payment"):
-            modified.financing.calculate_loan_details(modified.property.purchase_price)
+    def _financing_state(self, deal: Deal) -> Tuple[Tuple, List[Tuple]]:
+        """Snapshot the financing fields that calculations update in place."""
+        financing = deal.financing
+        return (
+            tuple(getattr(financing, name) for name in self.FINANCING_STATE_FIELDS),
+            [
+                tuple(getattr(track, name) for name in self.TRACK_STATE_FIELDS)
+                for track in financing.sub_loans
+            ],
+        )
 
-        return modified
+    def _restore_financing_state(self, deal: Deal, state: Tuple[Tuple, List[Tuple]]) -> None:
+        """Restore a snapshot taken by _financing_state."""
+        financing_values, track_values = state
+        for name, value in zip(self.FINANCING_STATE_FIELDS, financing_values):
+            setattr(deal.financing, name, value)
+        for track, values in zip(deal.financing.sub_loans, track_values):
+            for name, value in zip(self.TRACK_STATE_FIELDS, values):
+                setattr(track, name, value)
 
     def _set_modified_value(self, deal: Deal, variable: str, pct_change: float) -> None:
         """Set a modified value on the deal based on percentage change."""
-        path = self.VARIABLE_MAP[variable]
-        
-        # Navigate to the attribute
-        obj = deal
-        for attr in path[:-1]:
-            obj = getattr(obj, attr)
+        field = self.VARIABLE_MAP[variable][-1]
+        obj = self._FIELD_OWNERS[variable](deal)
         
         # Get current value and apply change
-        current = getattr(obj, path[-1])
+        current = getattr(obj, field)
         new_value = current * (1 + pct_change / 100)
         
         # Handle special cases
-        if "percent" in path[-1] or "rate" in path[-1]:
+        if variable in self.ADDITIVE_VARIABLES:
             # For percentages, add the change directly instead of multiplying
             new_value = current + pct_change
             new_value = max(0, new_value)  # Ensure non-negative
         
-        setattr(obj, path[-1], new_value)
+        setattr(obj, field, new_value)
 
     def _calculate_metric(
         self, deal: Deal, metric_name: str, holding_period: int
@@ -241,19 +288,39 @@ class SensitivityAnalyzer:
             return value
 
         # Metrics requiring full calculation
-        calculator = MetricsCalculator(deal)
-        result = calculator.calculate(holding_period=holding_period)
+        metric_map = self._full_metric_values(deal, holding_period)
         
-        if not result.success:
+        if metric_map is None:
             return 0.0
-
-        metrics = result.data
-        
-        metric_map = {
-            "irr": metrics.irr.value if metrics.irr else 0,
-            "npv": metrics.npv.value if metrics.npv else 0,
-            "equity_multiple": metrics.equity_multiple.value if metrics.equity_multiple else 0,
-            "break_even_ratio": metrics.break_even_ratio.value if metrics.break_even_ratio else 0,
-        }
         
         return metric_map.get(metric_name, 0)
+
+    def _full_metric_values(
+        self, deal: Deal, holding_period: int
+    ) -> Optional[Dict[str, float]]:
+        """Run MetricsCalculator for a deal, reusing results for identical deals.
+
+        The key is the deal's full JSON, so repeated grid points (across
+        calls and analyzers, or several metrics for one modified deal) are
+        calculated once and any change to the deal's inputs produces a new
+        key. Returns None if the calculation failed.
+        """
+        cache = self._metrics_cache
+        key = (deal.model_dump_json(), holding_period)
+        metric_map = cache.get(key, _MISSING)
+        if metric_map is not _MISSING:
+            return metric_map
+
+        result = MetricsCalculator(deal).calculate(holding_period=holding_period)
+        metric_map = None
+        if result.success:
+            metrics = result.data
+            metric_map = {
+                "irr": metrics.irr.value if metrics.irr else 0,
+                "npv": metrics.npv.value if metrics.npv else 0,
+                "equity_multiple": metrics.equity_multiple.value if metrics.equity_multiple else 0,
+                "break_even_ratio": metrics.break_even_ratio.value if metrics.break_even_ratio else 0,
+            }
+
+        cache.put(key, metric_map)
+        return metric_map
@@ -17,14 +17,17 @@ from .models import (
     MetricResult,
     MetricType,
 )
-from .calculators import (
-    Calculator,
-    CalculatorResult,
-    AmortizationCalculator,
-    CashFlowCalculator,
-    MetricsCalculator,
-    ProFormaCalculator,
-)
+from .._lazy import lazy_exports
+
+# Calculators load on first access so importing the models stays light
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    "Calculator": ".calculators",
+    "CalculatorResult": ".calculators",
+    "AmortizationCalculator": ".calculators",
+    "CashFlowCalculator": ".calculators",
+    "MetricsCalculator": ".calculators",
+    "ProFormaCalculator": ".calculators",
+})
 
 __all__ = [
     # Models
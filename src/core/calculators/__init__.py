@@ -1,10 +1,17 @@
 """Financial calculators for real estate analysis."""
 
-from .base import Calculator, CalculatorResult
-from .amortization import AmortizationCalculator
-from .cash_flow import CashFlowCalculator
-from .metrics import MetricsCalculator
-from .proforma import ProFormaCalculator
+from ..._lazy import lazy_exports
+
+# Calculators are imported on first access; they pull in pandas, which
+# callers that only need the models should not pay for
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    "Calculator": ".base",
+    "CalculatorResult": ".base",
+    "AmortizationCalculator": ".amortization",
+    "CashFlowCalculator": ".cash_flow",
+    "MetricsCalculator": ".metrics",
+    "ProFormaCalculator": ".proforma",
+})
 
 __all__ = [
     "Calculator",
@@ -13,4 +20,4 @@ __all__ = [
     "CashFlowCalculator", 
     "MetricsCalculator",
     "ProFormaCalculator",
-] 
\ No newline at end of file
+]
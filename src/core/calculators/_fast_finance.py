@@ -0,0 +1,83 @@
+"""Fast solvers for financial metrics, with numpy_financial as the fallback."""
+
+from typing import Sequence
+
+import numpy as np
+import numpy_financial as npf
+
+
+def _sign_changes(values: np.ndarray) -> int:
+    """Number of sign changes in a sequence, ignoring zeros."""
+    signs = np.sign(values[values != 0])
+    return int(np.count_nonzero(signs[1:] != signs[:-1]))
+
+
+def irr_newton(
+    cash_flows: Sequence[float],
+    guess: float = 0.1,
+    tol: float = 1e-14,
+    maxiter: int = 100,
+) -> float:
+    """Internal rate of return of periodic cash flows.
+
+    With exactly one sign change the NPV has a single root above -100%,
+    found by Newton's method on the NPV polynomial in 1 / (1 + rate),
+    evaluated with Horner's rule. Any other sequence (no IRR, or several),
+    or a Newton run that does not converge, goes to numpy_financial.irr,
+    which solves for all roots and returns the one closest to zero.
+
+    Args:
+        cash_flows: Cash flows for periods 0..N
+        guess: Starting rate for the Newton iteration
+        tol: Relative step size at which the iteration stops
+        maxiter: Maximum number of Newton steps
+    """
+    values = np.asarray(cash_flows, dtype=np.float64)
+    if len(values) < 2 or _sign_changes(values) != 1:
+        return float(npf.irr(values))
+
+    # NPV(rate) = sum(cf[t] * x**t) with x = 1 / (1 + rate); Horner's rule
+    # runs from the last coefficient down
+    coefficients = values[::-1].tolist()
+    x = 1 / (1 + guess)
+    for _ in range(maxiter):
+        f = 0.0
+        df = 0.0
+        for c in coefficients:
+            df = df * x + f
+            f = f * x + c
+        if df == 0 or not np.isfinite(f):
+            break
+        step = f / df
+        x -= step
+        if x <= 0 or not np.isfinite(x):
+            break
+        if abs(step) <= tol * x:
+            return 1 / x - 1
+
+    return float(npf.irr(values))
+
+
+def net_present_value(rate: float, cash_flows: Sequence[float]) -> float:
+    """Net present value of cash flows for periods 0..N at a periodic rate.
+
+    The same arithmetic as numpy_financial.npv (so the same result), as one
+    array expression on a float64 array without its generic broadcasting.
+    """
+    values = np.asarray(cash_flows, dtype=np.float64)
+    return float((values / (1 + rate) ** np.arange(len(values))).sum())
+
+
+def level_payment(rate: float, periods: int, principal: float) -> float:
+    """Level payment that repays principal over periods at a periodic rate.
+
+    The numpy_financial.pmt formula (payments at period end, no future
+    value) evaluated on Python floats, so a scalar call skips the array
+    conversions. Returned as a positive amount. The growth factor goes
+    through np.power, like pmt's, since the ufunc can differ from Python's
+    float pow in the last bit.
+    """
+    if rate == 0:
+        return principal / periods
+    growth = float(np.power(1 + rate, periods))
+    return principal * growth / ((growth - 1) / rate)
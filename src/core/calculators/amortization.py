@@ -1,16 +1,25 @@
 """Amortization schedule calculator with Israeli mortgage event engine."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
-import numpy_financial as npf
 from pydantic import BaseModel, Field
 
-from .base import Calculator, CalculatorResult
+from ._fast_finance import level_payment
+from .base import (
+    Calculator,
+    CalculatorResult,
+    LRUCache,
+    aggregate_by_year,
+    records_to_dataframe,
+)
 from ..models.financing import (
     SubLoan,
     RepaymentMethod,
     GraceType,
+    Prepayment,
     PrepaymentOption,
+    RateChange,
 )
 
 
@@ -30,6 +39,123 @@ class AmortizationPayment(BaseModel):
     events: List[str] = Field(default_factory=list)
 
 
+class TrackScheduleArrays(BaseModel):
+    """Column-oriented amortization schedule for a single track.
+
+    Each numeric column holds one value per month (index 0 is month 1).
+    Events are sparse and keyed by payment number.
+    """
+
+    payment_number: np.ndarray
+    beginning_balance: np.ndarray
+    payment_amount: np.ndarray
+    principal_payment: np.ndarray
+    interest_payment: np.ndarray
+    ending_balance: np.ndarray
+    cumulative_principal: np.ndarray
+    cumulative_interest: np.ndarray
+    events: Dict[int, List[str]] = Field(default_factory=dict)
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @property
+    def num_payments(self) -> int:
+        """Number of months in the schedule."""
+        return len(self.payment_number)
+
+    def to_payments(
+        self, start_month: int = 1, end_month: Optional[int] = None
+    ) -> List[AmortizationPayment]:
+        """Build payment records for months ``start_month``..``end_month`` (inclusive).
+
+        Records outside the requested range are never constructed.
+        """
+        lo = max(start_month, 1) - 1
+        hi = self.num_payments if end_month is None else min(end_month, self.num_payments)
+        if hi <= lo:
+            return []
+
+        window = slice(lo, hi)
+        columns = zip(
+            self.payment_number[window].tolist(),
+            self.beginning_balance[window].tolist(),
+            self.payment_amount[window].tolist(),
+            self.principal_payment[window].tolist(),
+            self.interest_payment[window].tolist(),
+            self.ending_balance[window].tolist(),
+            self.cumulative_principal[window].tolist(),
+            self.cumulative_interest[window].tolist(),
+        )
+        # Values come straight from float64 arrays, so validation is skipped
+        return [
+            AmortizationPayment.model_construct(
+                payment_number=m,
+                year=(m - 1) // 12 + 1,
+                month=((m - 1) % 12) + 1,
+                beginning_balance=beginning,
+                payment_amount=payment,
+                principal_payment=principal,
+                interest_payment=interest,
+                ending_balance=ending,
+                cumulative_principal=cum_principal,
+                cumulative_interest=cum_interest,
+                events=list(self.events.get(m, [])),
+            )
+            for (
+                m,
+                beginning,
+                payment,
+                principal,
+                interest,
+                ending,
+                cum_principal,
+                cum_interest,
+            ) in columns
+        ]
+
+
+def sum_track_columns(
+    schedules: Sequence[TrackScheduleArrays],
+    columns: Sequence[str],
+    num_months: Optional[int] = None,
+) -> np.ndarray:
+    """Sum the given columns across track schedules, month by month.
+
+    Shorter schedules are zero-padded to ``num_months`` (default: the longest
+    schedule). Returns an array of shape ``(num_months, len(columns))``.
+    """
+    if num_months is None:
+        num_months = max((sched.num_payments for sched in schedules), default=0)
+
+    totals = np.zeros((num_months, len(columns)))
+    for sched in schedules:
+        n = min(sched.num_payments, num_months)
+        for j, column in enumerate(columns):
+            totals[:n, j] += getattr(sched, column)[:n]
+    return totals
+
+
+def _round_cents(values: Sequence[float]) -> np.ndarray:
+    """Round values to cents exactly as Python's round(value, 2) does.
+
+    np.round scales by 100 and rounds to the nearest integer, which can
+    land on the wrong side of a half cent when the scaling itself rounds.
+    That only happens within a couple of ulps of a half cent (or when the
+    scaling overflows), so just those values are redone with round().
+    """
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(over="ignore", invalid="ignore"):
+        scaled = values * 100
+        rounded = np.rint(scaled) / 100
+        ambiguous = ~np.isfinite(scaled) | (
+            np.abs(scaled - np.floor(scaled) - 0.5) <= 2 * np.abs(np.spacing(scaled))
+        )
+    for i in np.flatnonzero(ambiguous).tolist():
+        rounded.flat[i] = round(float(values.flat[i]), 2)
+    return rounded
+
+
 class AmortizationSchedule(BaseModel):
     """Complete amortization schedule."""
 
@@ -45,39 +171,39 @@ class AmortizationSchedule(BaseModel):
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert schedule to pandas DataFrame."""
-        return pd.DataFrame([p.dict() for p in self.payments])
+        return records_to_dataframe(self.payments)
 
     def get_yearly_summary(self) -> pd.DataFrame:
         """Get yearly summary of payments."""
-        df = self.to_dataframe()
-        yearly = (
-            df.groupby("year")
-            .agg(
-                {
-                    "payment_amount": "sum",
-                    "principal_payment": "sum",
-                    "interest_payment": "sum",
-                    "ending_balance": "last",
-                    "cumulative_principal": "last",
-                    "cumulative_interest": "last",
-                }
-            )
-            .round(2)
-        )
-        return yearly
+        aggregations = {
+            "payment_amount": "sum",
+            "principal_payment": "sum",
+            "interest_payment": "sum",
+            "ending_balance": "last",
+            "cumulative_principal": "last",
+            "cumulative_interest": "last",
+        }
+        yearly = aggregate_by_year(self.payments, aggregations)
+        if yearly is None:
+            yearly = self.to_dataframe().groupby("year").agg(aggregations)
+        return yearly.round(2)
 
     def get_track_dataframe(self, track_name: str) -> Optional[pd.DataFrame]:
         """Get a DataFrame for a specific track's schedule."""
         if track_name not in self.track_schedules:
             return None
-        return pd.DataFrame(
-            [p.dict() for p in self.track_schedules[track_name]]
-        )
+        return records_to_dataframe(self.track_schedules[track_name])
 
 
 class AmortizationCalculator(Calculator):
     """Calculator for loan amortization schedules."""
 
+    # Yearly summary columns keyed by the financing's JSON, shared by all
+    # calculators (the schedule depends on nothing else)
+    YEARLY_CACHE_SIZE = 128
+    YEARLY_COLUMNS = ("payment_amount", "principal_payment", "interest_payment", "ending_balance")
+    _yearly_cache = LRUCache(YEARLY_CACHE_SIZE)
+
     def calculate(self, **kwargs) -> CalculatorResult:
         """Calculate amortization schedule."""
         financing = self.deal.financing
@@ -113,6 +239,34 @@ class AmortizationCalculator(Calculator):
 
             return CalculatorResult(success=True, data=schedule)
 
+    def calculate_yearly_columns(self) -> Optional[Dict[str, np.ndarray]]:
+        """Yearly summary columns (read-only arrays), or None if the schedule fails.
+
+        Results are reused for identical financing. A calculation that
+        changes the financing's own fields (derived loan state) is not
+        cached, so later calls still make that update.
+        """
+        financing = self.deal.financing
+        cache = self._yearly_cache
+        key = financing.model_dump_json()
+        columns = cache.get(key)
+        if columns is not None:
+            return columns
+
+        result = self.calculate()
+        if not result.success:
+            return None
+        yearly = result.data.get_yearly_summary()
+        columns = {}
+        for name in self.YEARLY_COLUMNS:
+            values = yearly[name].to_numpy(dtype=float, copy=True)
+            values.setflags(write=False)
+            columns[name] = values
+
+        if financing.model_dump_json() == key:
+            cache.put(key, columns)
+        return columns
+
     def _calculate_simple_schedule(
         self, loan_amount: float, annual_rate: float, years: int
     ) -> AmortizationSchedule:
@@ -121,55 +275,71 @@ class AmortizationCalculator(Calculator):
         num_payments = years * 12
 
         if monthly_rate > 0:
-            monthly_payment = float(npf.pmt(monthly_rate, num_payments, -loan_amount))
+            monthly_payment = level_payment(monthly_rate, num_payments, loan_amount)
         else:
             monthly_payment = loan_amount / num_payments
 
-        payments = []
-        balance = loan_amount
-        cumulative_principal = 0
-        cumulative_interest = 0
-
-        for i in range(1, num_payments + 1):
-            interest = balance * monthly_rate
-            principal = monthly_payment - interest
-
-            if balance < principal:
-                principal = balance
-                monthly_payment = principal + interest
-
-            balance -= principal
-            cumulative_principal += principal
-            cumulative_interest += interest
-
-            payment = AmortizationPayment(
-                payment_number=i,
-                year=(i - 1) // 12 + 1,
-                month=(i - 1) % 12 + 1,
-                beginning_balance=balance + principal,
-                payment_amount=monthly_payment,
-                principal_payment=principal,
-                interest_payment=interest,
-                ending_balance=max(0, balance),
-                cumulative_principal=cumulative_principal,
-                cumulative_interest=cumulative_interest,
-            )
-
-            payments.append(payment)
-
-            if balance <= 0:
-                break
-
-        total_interest = cumulative_interest
-
+        arrays, monthly_payment = self._level_payment_arrays(
+            loan_amount, monthly_rate, monthly_payment, num_payments
+        )
         return AmortizationSchedule(
             loan_amount=loan_amount,
             interest_rate=annual_rate * 100,
             loan_term_years=years,
             monthly_payment=monthly_payment,
-            total_interest_paid=total_interest,
-            payments=payments,
+            total_interest_paid=float(arrays.cumulative_interest[-1]),
+            payments=arrays.to_payments(),
+        )
+
+    @staticmethod
+    def _level_payment_arrays(
+        loan_amount: float, monthly_rate: float, monthly_payment: float, num_payments: int
+    ) -> Tuple[TrackScheduleArrays, float]:
+        """Closed-form schedule for a level-payment loan.
+
+        The balance after k payments is L(1+r)^k - P((1+r)^k - 1)/r (L - kP
+        at a zero rate), so every month is computed at once instead of
+        stepping the recurrence. The payment that would overshoot the
+        remaining balance is reduced to pay it off and ends the schedule.
+
+        Returns the schedule columns and the final monthly payment.
+        """
+        k = np.arange(num_payments, dtype=np.float64)
+        if monthly_rate == 0:
+            opening = loan_amount - monthly_payment * k
+        else:
+            growth = (1 + monthly_rate) ** k
+            opening = loan_amount * growth - monthly_payment * (growth - 1) / monthly_rate
+        interest = opening * monthly_rate
+        principal = monthly_payment - interest
+        payment = np.full(num_payments, monthly_payment)
+
+        # The loop stops at the first month that clears the balance
+        payoff = opening < principal
+        ending = np.where(payoff, 0.0, opening - principal)
+        done = np.flatnonzero(payoff | (ending <= 0))
+        if done.size:
+            last = int(done[0])
+            n = last + 1
+            if payoff[last]:
+                principal[last] = opening[last]
+                payment[last] = principal[last] + interest[last]
+                monthly_payment = float(payment[last])
+            opening, interest, principal, payment, ending = (
+                col[:n] for col in (opening, interest, principal, payment, ending)
+            )
+
+        arrays = TrackScheduleArrays(
+            payment_number=np.arange(1, len(payment) + 1, dtype=np.int64),
+            beginning_balance=ending + principal,
+            payment_amount=payment,
+            principal_payment=principal,
+            interest_payment=interest,
+            ending_balance=np.maximum(ending, 0.0),
+            cumulative_principal=np.cumsum(principal),
+            cumulative_interest=np.cumsum(interest),
         )
+        return arrays, monthly_payment
 
     @staticmethod
     def generate_track_schedule(sub_loan: SubLoan) -> List[AmortizationPayment]:
@@ -178,15 +348,52 @@ class AmortizationCalculator(Calculator):
         Handles all advanced features: repayment methods (Spitzer/Equal/Bullet),
         grace periods, CPI indexation, dynamic rate changes, and prepayments.
         """
+        return AmortizationCalculator.generate_track_arrays(sub_loan).to_payments()
+
+    @staticmethod
+    def generate_track_arrays(sub_loan: SubLoan) -> TrackScheduleArrays:
+        """Generate a single track's schedule as NumPy columns.
+
+        Same engine as ``generate_track_schedule`` but skips building a
+        Pydantic record per month; callers that only display or aggregate
+        part of the schedule can materialize rows via ``to_payments``.
+        """
+        beginning_col: List[float] = []
+        payment_col: List[float] = []
+        principal_col: List[float] = []
+        interest_col: List[float] = []
+        ending_col: List[float] = []
+        cum_principal_col: List[float] = []
+        cum_interest_col: List[float] = []
+        month_events: Dict[int, List[str]] = {}
+
         if sub_loan.loan_amount <= 0:
-            return []
+            return AmortizationCalculator._pack_track_arrays(
+                beginning_col,
+                payment_col,
+                principal_col,
+                interest_col,
+                ending_col,
+                cum_principal_col,
+                cum_interest_col,
+                month_events,
+            )
 
         method = sub_loan.repayment_method
         effective_rate_pct = sub_loan.calculate_effective_rate()
         term_months = sub_loan.loan_term_months
         grace = sub_loan.grace_period
-        rate_changes = sorted(sub_loan.rate_changes, key=lambda rc: rc.month)
-        prepayments = sorted(sub_loan.prepayments, key=lambda pp: pp.month)
+        is_spitzer = method == RepaymentMethod.SPITZER
+        is_equal_principal = method == RepaymentMethod.EQUAL_PRINCIPAL
+
+        # Rate changes and prepayments grouped by month (same-month entries
+        # keep their input order), so each month only looks up its own
+        rate_changes: Dict[int, List[RateChange]] = {}
+        for rc in sub_loan.rate_changes:
+            rate_changes.setdefault(rc.month, []).append(rc)
+        prepayments: Dict[int, List[Prepayment]] = {}
+        for pp in sub_loan.prepayments:
+            prepayments.setdefault(pp.month, []).append(pp)
 
         current_rate = effective_rate_pct / 100.0
         current_monthly_rate = current_rate / 12.0
@@ -205,19 +412,31 @@ class AmortizationCalculator(Calculator):
         balance = sub_loan.loan_amount
         grace_months = grace.duration_months if grace else 0
         grace_ended = grace is None or grace_months == 0
+        deferral_months = grace_months if grace and grace.grace_type == GraceType.FULL_DEFERRAL else 0
+        interest_only_months = grace_months if grace and grace.grace_type == GraceType.INTEREST_ONLY else 0
 
         fixed_payment: Optional[float] = None
         principal_installment: Optional[float] = None
 
         if grace_ended:
-            if method == RepaymentMethod.SPITZER:
-                fixed_payment = float(
-                    -npf.pmt(current_monthly_rate, term_months, balance)
-                )
-            elif method == RepaymentMethod.EQUAL_PRINCIPAL:
+            if is_spitzer:
+                fixed_payment = level_payment(current_monthly_rate, term_months, balance)
+            elif is_equal_principal:
                 principal_installment = balance / term_months
 
-        schedule: List[AmortizationPayment] = []
+        # A bullet track without events is closed-form (see _bullet_arrays)
+        if (
+            method == RepaymentMethod.BULLET
+            and grace_ended
+            and not rate_changes
+            and not prepayments
+        ):
+            bullet = AmortizationCalculator._bullet_arrays(
+                balance, current_monthly_rate, monthly_inflation, term_months
+            )
+            if bullet is not None:
+                return bullet
+
         cumulative_principal = 0.0
         cumulative_interest = 0.0
 
@@ -226,26 +445,19 @@ class AmortizationCalculator(Calculator):
             beginning_balance = balance
 
             # --- Rate changes at this month ---
-            for rc in rate_changes:
-                if rc.month == m:
-                    current_rate += rc.delta / 100.0
-                    current_monthly_rate = current_rate / 12.0
-                    if grace_ended and method == RepaymentMethod.SPITZER:
-                        remaining = term_months - (m - 1)
-                        if remaining > 0 and current_monthly_rate > 0:
-                            fixed_payment = float(
-                                -npf.pmt(current_monthly_rate, remaining, balance)
-                            )
-                    events.append(
-                        f"rate_change: {'+' if rc.delta >= 0 else ''}{rc.delta}%"
-                    )
+            for rc in rate_changes.get(m, ()):
+                current_rate += rc.delta / 100.0
+                current_monthly_rate = current_rate / 12.0
+                if grace_ended and is_spitzer:
+                    remaining = term_months - (m - 1)
+                    if remaining > 0 and current_monthly_rate > 0:
+                        fixed_payment = level_payment(current_monthly_rate, remaining, balance)
+                events.append(
+                    f"rate_change: {'+' if rc.delta >= 0 else ''}{rc.delta}%"
+                )
 
             # --- Grace: full deferral ---
-            if (
-                grace
-                and grace.grace_type == GraceType.FULL_DEFERRAL
-                and m <= grace_months
-            ):
+            if m <= deferral_months:
                 if monthly_inflation:
                     balance *= 1 + monthly_inflation
                 interest = balance * current_monthly_rate
@@ -256,11 +468,7 @@ class AmortizationCalculator(Calculator):
                     events.append("grace:full_deferral")
 
             # --- Grace: interest only ---
-            elif (
-                grace
-                and grace.grace_type == GraceType.INTEREST_ONLY
-                and m <= grace_months
-            ):
+            elif m <= interest_only_months:
                 if monthly_inflation:
                     balance *= 1 + monthly_inflation
                 interest = balance * current_monthly_rate
@@ -275,11 +483,9 @@ class AmortizationCalculator(Calculator):
                 if not grace_ended and m == grace_months + 1:
                     grace_ended = True
                     remaining = term_months - grace_months
-                    if method == RepaymentMethod.SPITZER:
-                        fixed_payment = float(
-                            -npf.pmt(current_monthly_rate, remaining, balance)
-                        )
-                    elif method == RepaymentMethod.EQUAL_PRINCIPAL:
+                    if is_spitzer:
+                        fixed_payment = level_payment(current_monthly_rate, remaining, balance)
+                    elif is_equal_principal:
                         principal_installment = balance / remaining
                     events.append("grace_end")
 
@@ -288,15 +494,13 @@ class AmortizationCalculator(Calculator):
                     balance *= 1 + monthly_inflation
                     remaining = term_months - (m - 1)
                     if remaining > 0:
-                        if method == RepaymentMethod.SPITZER:
-                            fixed_payment = float(
-                                -npf.pmt(current_monthly_rate, remaining, balance)
-                            )
-                        elif method == RepaymentMethod.EQUAL_PRINCIPAL:
+                        if is_spitzer:
+                            fixed_payment = level_payment(current_monthly_rate, remaining, balance)
+                        elif is_equal_principal:
                             principal_installment = balance / remaining
 
                 # Payment calculation per method
-                if method == RepaymentMethod.SPITZER:
+                if is_spitzer:
                     interest = balance * current_monthly_rate
                     payment = float(fixed_payment)  # type: ignore[arg-type]
                     principal_paid = payment - interest
@@ -306,7 +510,7 @@ class AmortizationCalculator(Calculator):
                         payment = principal_paid + interest
                     balance -= principal_paid
 
-                elif method == RepaymentMethod.EQUAL_PRINCIPAL:
+                elif is_equal_principal:
                     interest = balance * current_monthly_rate
                     principal_paid = float(principal_installment)  # type: ignore[arg-type]
                     if principal_paid > balance:
@@ -328,118 +532,165 @@ class AmortizationCalculator(Calculator):
                     raise ValueError(f"Unknown repayment method: {method}")
 
             # --- Prepayments ---
-            for pp in prepayments:
-                if pp.month == m:
-                    extra = min(pp.amount, balance)
-                    payment += extra
-                    principal_paid += extra
-                    balance -= extra
-
-                    remaining = term_months - m
-                    if remaining > 0 and pp.option == PrepaymentOption.REDUCE_PAYMENT:
-                        if method == RepaymentMethod.SPITZER:
-                            fixed_payment = float(
-                                -npf.pmt(current_monthly_rate, remaining, balance)
-                            )
-                        elif method == RepaymentMethod.EQUAL_PRINCIPAL:
-                            principal_installment = balance / remaining
-                    # REDUCE_TERM: keep same payment, loan ends earlier naturally
-                    events.append(
-                        f"prepayment: {extra:,.0f} ({pp.option.value})"
-                    )
+            for pp in prepayments.get(m, ()):
+                extra = min(pp.amount, balance)
+                payment += extra
+                principal_paid += extra
+                balance -= extra
+
+                remaining = term_months - m
+                if remaining > 0 and pp.option == PrepaymentOption.REDUCE_PAYMENT:
+                    if is_spitzer:
+                        fixed_payment = level_payment(current_monthly_rate, remaining, balance)
+                    elif is_equal_principal:
+                        principal_installment = balance / remaining
+                # REDUCE_TERM: keep same payment, loan ends earlier naturally
+                events.append(
+                    f"prepayment: {extra:,.0f} ({pp.option.value})"
+                )
 
             cumulative_principal += principal_paid
             cumulative_interest += interest
 
-            schedule.append(
-                AmortizationPayment(
-                    payment_number=m,
-                    year=(m - 1) // 12 + 1,
-                    month=((m - 1) % 12) + 1,
-                    beginning_balance=round(beginning_balance, 2),
-                    payment_amount=round(payment, 2),
-                    principal_payment=round(principal_paid, 2),
-                    interest_payment=round(interest, 2),
-                    ending_balance=round(max(balance, 0), 2),
-                    cumulative_principal=round(cumulative_principal, 2),
-                    cumulative_interest=round(cumulative_interest, 2),
-                    events=events,
-                )
-            )
+            # Rounded to cents column by column in _pack_track_arrays
+            beginning_col.append(beginning_balance)
+            payment_col.append(payment)
+            principal_col.append(principal_paid)
+            interest_col.append(interest)
+            ending_col.append(max(balance, 0))
+            cum_principal_col.append(cumulative_principal)
+            cum_interest_col.append(cumulative_interest)
+            if events:
+                month_events[m] = events
 
             if balance <= 0.01:
                 break
 
-        return schedule
+        return AmortizationCalculator._pack_track_arrays(
+            beginning_col,
+            payment_col,
+            principal_col,
+            interest_col,
+            ending_col,
+            cum_principal_col,
+            cum_interest_col,
+            month_events,
+        )
+
+    @staticmethod
+    def _bullet_arrays(
+        loan_amount: float, monthly_rate: float, monthly_inflation: float, term_months: int
+    ) -> Optional[TrackScheduleArrays]:
+        """Schedule of a bullet track with no grace, rate changes or prepayments.
+
+        Each month indexes the balance by CPI and pays its interest; the last
+        month also repays the balance. The indexed balances are a sequential
+        cumprod, the same multiplications the monthly loop makes, so the
+        rows are identical. Returns None if the loop would have stopped
+        early on a near-zero balance.
+        """
+        indexed = np.cumprod(
+            np.concatenate(([loan_amount], np.full(term_months, 1 + monthly_inflation)))
+        )
+        balance = indexed[1:]
+        if np.any(balance[:-1] <= 0.01):
+            return None
+
+        interest = balance * monthly_rate
+        principal = np.zeros(term_months)
+        principal[-1] = balance[-1]
+        payment = interest.copy()
+        payment[-1] = interest[-1] + balance[-1]
+        ending = balance.copy()
+        ending[-1] = 0.0
+
+        return TrackScheduleArrays(
+            payment_number=np.arange(1, term_months + 1, dtype=np.int64),
+            beginning_balance=_round_cents(indexed[:-1]),
+            payment_amount=_round_cents(payment),
+            principal_payment=_round_cents(principal),
+            interest_payment=_round_cents(interest),
+            ending_balance=_round_cents(ending),
+            cumulative_principal=_round_cents(np.cumsum(principal)),
+            cumulative_interest=_round_cents(np.cumsum(interest)),
+        )
+
+    @staticmethod
+    def _pack_track_arrays(
+        beginning_col: List[float],
+        payment_col: List[float],
+        principal_col: List[float],
+        interest_col: List[float],
+        ending_col: List[float],
+        cum_principal_col: List[float],
+        cum_interest_col: List[float],
+        month_events: Dict[int, List[str]],
+    ) -> TrackScheduleArrays:
+        """Round the per-month column lists to cents into a TrackScheduleArrays."""
+        return TrackScheduleArrays(
+            payment_number=np.arange(1, len(payment_col) + 1, dtype=np.int64),
+            beginning_balance=_round_cents(beginning_col),
+            payment_amount=_round_cents(payment_col),
+            principal_payment=_round_cents(principal_col),
+            interest_payment=_round_cents(interest_col),
+            ending_balance=_round_cents(ending_col),
+            cumulative_principal=_round_cents(cum_principal_col),
+            cumulative_interest=_round_cents(cum_interest_col),
+            events=month_events,
+        )
 
     def _calculate_israeli_mortgage_schedule(self, financing) -> CalculatorResult:
         """Calculate amortization schedule for Israeli mortgage with multiple tracks."""
         try:
-            track_schedules: Dict[str, List[AmortizationPayment]] = {}
-
+            track_arrays: Dict[str, TrackScheduleArrays] = {}
             for sub_loan in financing.sub_loans:
-                track_payments = self.generate_track_schedule(sub_loan)
-                track_schedules[sub_loan.name] = track_payments
-
-            # Build month→payment lookup per track
-            track_payment_maps: Dict[str, Dict[int, AmortizationPayment]] = {
-                name: {p.payment_number: p for p in payments}
-                for name, payments in track_schedules.items()
+                track_arrays[sub_loan.name] = self.generate_track_arrays(sub_loan)
+            track_schedules: Dict[str, List[AmortizationPayment]] = {
+                name: arrays.to_payments() for name, arrays in track_arrays.items()
             }
 
-            max_month = max(
-                max(p.payment_number for p in payments)
-                for payments in track_schedules.values()
-            ) if track_schedules else 0
-
-            combined: List[AmortizationPayment] = []
-            cumulative_principal = 0.0
-            cumulative_interest = 0.0
-
-            for month_num in range(1, max_month + 1):
-                total_beginning = 0.0
-                total_payment = 0.0
-                total_principal = 0.0
-                total_interest = 0.0
-                total_ending = 0.0
-                all_events: List[str] = []
-
-                for track_name, pmap in track_payment_maps.items():
-                    p = pmap.get(month_num)
-                    if p:
-                        total_beginning += p.beginning_balance
-                        total_payment += p.payment_amount
-                        total_principal += p.principal_payment
-                        total_interest += p.interest_payment
-                        total_ending += p.ending_balance
-                        for e in p.events:
-                            all_events.append(f"{track_name}: {e}")
-
-                if total_payment > 0 or total_beginning > 0:
-                    cumulative_principal += total_principal
-                    cumulative_interest += total_interest
-
-                    combined.append(
-                        AmortizationPayment(
-                            payment_number=month_num,
-                            year=(month_num - 1) // 12 + 1,
-                            month=((month_num - 1) % 12) + 1,
-                            beginning_balance=round(total_beginning, 2),
-                            payment_amount=round(total_payment, 2),
-                            principal_payment=round(total_principal, 2),
-                            interest_payment=round(total_interest, 2),
-                            ending_balance=round(total_ending, 2),
-                            cumulative_principal=round(cumulative_principal, 2),
-                            cumulative_interest=round(cumulative_interest, 2),
-                            events=all_events,
-                        )
+            # Month-by-month totals across tracks (tracks that have ended
+            # contribute nothing), summed column-wise in track order
+            totals = sum_track_columns(
+                list(track_arrays.values()),
+                (
+                    "beginning_balance",
+                    "payment_amount",
+                    "principal_payment",
+                    "interest_payment",
+                    "ending_balance",
+                ),
+            )
+            total_beginning, total_payment, total_principal, total_interest, total_ending = totals.T
+            months = np.flatnonzero((total_payment > 0) | (total_beginning > 0))
+
+            month_events: Dict[int, List[str]] = {}
+            for track_name, arrays in track_arrays.items():
+                for month_num, events in arrays.events.items():
+                    month_events.setdefault(month_num, []).extend(
+                        f"{track_name}: {e}" for e in events
                     )
 
+            # Cumulative totals run over the kept months only
+            combined_arrays = TrackScheduleArrays(
+                payment_number=months + 1,
+                beginning_balance=_round_cents(total_beginning[months]),
+                payment_amount=_round_cents(total_payment[months]),
+                principal_payment=_round_cents(total_principal[months]),
+                interest_payment=_round_cents(total_interest[months]),
+                ending_balance=_round_cents(total_ending[months]),
+                cumulative_principal=_round_cents(np.cumsum(total_principal[months])),
+                cumulative_interest=_round_cents(np.cumsum(total_interest[months])),
+                events=month_events,
+            )
+            combined = combined_arrays.to_payments()
+
             # Totals
             total_loan_amount = sum(
                 sub_loan.loan_amount for sub_loan in financing.sub_loans
             )
-            total_interest_paid = sum(p.interest_payment for p in combined)
+            # Summed from the rounded monthly column, as the records hold it
+            total_interest_paid = sum(combined_arrays.interest_payment.tolist())
             first_month_payment = combined[0].payment_amount if combined else 0
 
             # Weighted average interest rate
@@ -1,8 +1,12 @@
 """Base calculator abstract class."""
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, TypeVar
+from collections import OrderedDict
+from typing import Any, Collection, Dict, Generic, Hashable, Optional, Sequence, TypeVar
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel
 
 from ..models.deal import Deal
@@ -10,6 +14,123 @@ from ..models.deal import Deal
 T = TypeVar('T', bound=BaseModel)
 
 
+class LRUCache:
+    """Small thread-safe least-recently-used cache.
+
+    Calculators keep these at class level, so one instance is shared by
+    every session thread; each lookup and insert holds the lock.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for ``key`` (marking it recently used), or ``default``."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def records_to_dataframe(
+    records: Sequence[BaseModel], exclude: Collection[str] = ()
+) -> pd.DataFrame:
+    """Build a DataFrame from flat model records, one column per field.
+
+    Equivalent to ``pd.DataFrame([r.dict() for r in records])`` without
+    serializing every record: each column is read straight off the models.
+    List and dict values are copied so the frame does not share them.
+    """
+    if not records:
+        return pd.DataFrame()
+
+    columns = {}
+    for name in type(records[0]).model_fields:
+        if name in exclude:
+            continue
+        values = [getattr(record, name) for record in records]
+        if isinstance(values[0], (list, dict)):
+            values = [type(value)(value) for value in values]
+        columns[name] = values
+    return pd.DataFrame(columns)
+
+
+def _grouped_kahan_sum(padded: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Row sums of ``padded`` over its ``valid`` cells, in column order.
+
+    Uses the same compensated (Kahan) summation as pandas' groupby sum, one
+    column step at a time for all rows, so results match it exactly.
+    """
+    total = np.zeros(padded.shape[0])
+    compensation = np.zeros(padded.shape[0])
+    for k in range(padded.shape[1]):
+        value = padded[:, k]
+        use = valid[:, k] & ~np.isnan(value)
+        y = value - compensation
+        t = total + y
+        new_compensation = t - total - y
+        # An infinite value makes the compensation NaN; pandas resets it
+        new_compensation[np.isnan(new_compensation)] = 0
+        total = np.where(use, t, total)
+        compensation = np.where(use, new_compensation, compensation)
+    return total
+
+
+def aggregate_by_year(
+    records: Sequence[BaseModel], aggregations: Dict[str, str]
+) -> Optional[pd.DataFrame]:
+    """Per-year "sum"/"last" aggregates of monthly records, indexed by year.
+
+    A reshape-and-reduce over the record columns, equivalent to
+    ``records_to_dataframe(records).groupby("year").agg(aggregations)``
+    for records in year order. Returns None when that precondition does not
+    hold (no records, or years out of order) so callers can use groupby.
+    """
+    if not records:
+        return None
+    years = np.array([record.year for record in records])
+    if np.any(np.diff(years) < 0):
+        return None
+
+    starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+    ends = np.r_[starts[1:], len(years)]
+    lengths = ends - starts
+    offsets = np.arange(lengths.max())
+    valid = offsets[np.newaxis, :] < lengths[:, np.newaxis]
+    cells = np.minimum(starts[:, np.newaxis] + offsets, len(years) - 1)
+
+    columns = {}
+    for name, how in aggregations.items():
+        values = np.array([getattr(record, name) for record in records], dtype=np.float64)
+        if how == "sum":
+            columns[name] = _grouped_kahan_sum(values[cells], valid)
+        elif how == "last":
+            columns[name] = values[ends - 1]
+        else:
+            return None
+    return pd.DataFrame(columns, index=pd.Index(years[starts], name="year"))
+
+
 class CalculatorResult(BaseModel, Generic[T]):
     """Generic result container for calculator outputs."""
     
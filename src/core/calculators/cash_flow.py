@@ -1,11 +1,12 @@
 """Cash flow analysis calculator."""
 
 from typing import Dict, List
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 from loguru import logger
 
-from .base import Calculator, CalculatorResult
+from .base import Calculator, CalculatorResult, aggregate_by_year, records_to_dataframe
 
 
 class MonthlyCashFlow(BaseModel):
@@ -55,18 +56,21 @@ class CashFlowAnalysis(BaseModel):
     
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to pandas DataFrame."""
-        return pd.DataFrame([flow.dict() for flow in self.monthly_flows])
+        return records_to_dataframe(self.monthly_flows)
     
     def get_yearly_summary(self) -> pd.DataFrame:
         """Get yearly summary of cash flows."""
-        df = self.to_dataframe()
-        return df.groupby('year').agg({
+        aggregations = {
             'effective_income': 'sum',
             'total_expenses': 'sum',
             'net_operating_income': 'sum',
             'debt_service': 'sum',
             'pre_tax_cash_flow': 'sum'
-        }).round(2)
+        }
+        yearly = aggregate_by_year(self.monthly_flows, aggregations)
+        if yearly is None:
+            yearly = self.to_dataframe().groupby('year').agg(aggregations)
+        return yearly.round(2)
 
 
 class CashFlowCalculator(Calculator):
@@ -82,26 +86,33 @@ class CashFlowCalculator(Calculator):
                 errors=errors
             )
         
+        self._precompute_other_items()
+
+        # Every month of a year has the same figures, so each year is
+        # calculated once and its January record copied for months 2-12
         monthly_flows = []
-        cumulative_cash_flow = 0
-        
         for year in range(1, years + 1):
-            for month in range(1, 13):
-                month_data = self._calculate_month(year, month)
-                cumulative_cash_flow += month_data.pre_tax_cash_flow
-                month_data.cumulative_cash_flow = cumulative_cash_flow
-                monthly_flows.append(month_data)
-        
-        # Calculate summary statistics
-        df = pd.DataFrame([flow.dict() for flow in monthly_flows])
+            january = self._calculate_year(year)
+            monthly_flows.append(january)
+            monthly_flows.extend(
+                january.model_copy(update={"month": month}) for month in range(2, 13)
+            )
+
+        noi = np.array([flow.net_operating_income for flow in monthly_flows])
+        cash_flow = np.array([flow.pre_tax_cash_flow for flow in monthly_flows])
+        cumulative_cash_flow = np.cumsum(cash_flow)
+        for flow, cumulative in zip(monthly_flows, cumulative_cash_flow.tolist()):
+            flow.cumulative_cash_flow = cumulative
         
+        # Calculate summary statistics (NaN, as pandas gives, with no months)
+        has_flows = len(monthly_flows) > 0
         analysis = CashFlowAnalysis(
             monthly_flows=monthly_flows,
-            average_monthly_noi=df['net_operating_income'].mean(),
-            average_monthly_cash_flow=df['pre_tax_cash_flow'].mean(),
-            total_year1_cash_flow=df[df['year'] == 1]['pre_tax_cash_flow'].sum(),
-            months_to_positive_cash_flow=self._find_positive_cash_flow_month(monthly_flows),
-            cash_flow_volatility=df['pre_tax_cash_flow'].std()
+            average_monthly_noi=float(noi.mean()) if has_flows else float('nan'),
+            average_monthly_cash_flow=float(cash_flow.mean()) if has_flows else float('nan'),
+            total_year1_cash_flow=float(cash_flow[:12].sum()),
+            months_to_positive_cash_flow=self._find_positive_cash_flow_month(cumulative_cash_flow),
+            cash_flow_volatility=float(cash_flow.std(ddof=1)) if len(monthly_flows) > 1 else float('nan')
         )
         
         return CalculatorResult(
@@ -109,18 +120,36 @@ class CashFlowCalculator(Calculator):
             data=analysis
         )
     
-    def _calculate_month(self, year: int, month: int) -> MonthlyCashFlow:
-        """Calculate cash flow for a specific month."""
+    def _precompute_other_items(self) -> None:
+        """Compute the year-independent parts of other income and expenses.
+
+        Other income is a fixed monthly sum scaled by rent growth. Other
+        expenses given as an amount are fixed; only percentage-of-income
+        ones (stored as None here) depend on each year's EGI.
+        """
         deal = self.deal
+        num_units = deal.property.num_units
+        self._other_income_monthly = sum(
+            item.get_total_monthly(num_units) for item in deal.income.other_income
+        )
+        self._other_expenses_fixed_monthly = [
+            None
+            if expense.annual_amount is None and expense.monthly_amount is None
+            and expense.percentage_of_income is not None
+            else expense.calculate_annual_expense(0, num_units) / 12
+            for expense in deal.expenses.other_expenses
+        ]
+
+    def _calculate_year(self, year: int) -> MonthlyCashFlow:
+        """Calculate the monthly cash flow for a year (its January record)."""
+        deal = self.deal
+        month = 1
         
         # Income with growth
         growth_factor = (1 + deal.income.annual_rent_increase_percent / 100) ** (year - 1)
         
         gross_rent = (deal.income.monthly_rent_per_unit * deal.property.num_units) * growth_factor
-        other_income = sum(
-            item.get_total_monthly(deal.property.num_units) 
-            for item in deal.income.other_income
-        ) * growth_factor
+        other_income = self._other_income_monthly * growth_factor
         
         total_income = gross_rent + other_income
         vacancy_loss = total_income * (deal.income.vacancy_rate_percent / 100)
@@ -141,8 +170,11 @@ class CashFlowCalculator(Calculator):
         
         # Other expenses
         other_expenses = sum(
-            expense.calculate_annual_expense(annual_egi, deal.property.num_units) / 12
-            for expense in deal.expenses.other_expenses
+            fixed_monthly if fixed_monthly is not None
+            else expense.calculate_annual_expense(annual_egi, deal.property.num_units) / 12
+            for expense, fixed_monthly in zip(
+                deal.expenses.other_expenses, self._other_expenses_fixed_monthly
+            )
         )
         
         total_expenses = (
@@ -155,87 +187,88 @@ class CashFlowCalculator(Calculator):
         debt_service = deal.financing.monthly_payment or 0
         cash_flow = noi - debt_service
         
-        # OPEX Logging - Log every January (month 1) or first month
-        if month == 1:
-            logger.info(f"\n{'='*80}")
-            logger.info(f"OPEX BREAKDOWN - Year {year}, Month {month} | Deal: {deal.deal_id}")
-            logger.info(f"{'='*80}")
-            
-            # Income section
-            logger.info(f"\n📊 INCOME CALCULATION:")
-            logger.info(f"  Growth Factor = (1 + {deal.income.annual_rent_increase_percent}% / 100) ^ ({year} - 1) = {growth_factor:.4f}")
-            logger.info(f"  Gross Rent = ({deal.income.monthly_rent_per_unit:.2f} × {deal.property.num_units} units) × {growth_factor:.4f} = {gross_rent:.2f}")
-            logger.info(f"  Other Income = {other_income:.2f}")
-            logger.info(f"  Total Income = {gross_rent:.2f} + {other_income:.2f} = {total_income:.2f}")
-            logger.info(f"  Vacancy Loss = {total_income:.2f} × {deal.income.vacancy_rate_percent}% = {vacancy_loss:.2f}")
-            logger.info(f"  Effective Income = {total_income:.2f} - {vacancy_loss:.2f} = {effective_income:.2f}")
-            logger.info(f"  Annual EGI = {effective_income:.2f} × 12 = {annual_egi:.2f}")
-            
-            # OPEX section
-            logger.info(f"\n💰 OPEX CALCULATION:")
-            logger.info(f"  Expense Growth Factor = (1 + {deal.expenses.annual_expense_growth_percent}% / 100) ^ ({year} - 1) = {expense_growth:.4f}")
-            
-            logger.info(f"\n  📌 FIXED EXPENSES:")
-            logger.info(f"    Property Tax = ({deal.expenses.property_tax_annual:.2f} / 12) × {expense_growth:.4f} = {property_tax:.2f}")
-            logger.info(f"    Insurance = ({deal.expenses.insurance_annual:.2f} / 12) × {expense_growth:.4f} = {insurance:.2f}")
-            logger.info(f"    HOA = {deal.expenses.hoa_monthly:.2f} × {expense_growth:.4f} = {hoa:.2f}")
-            logger.info(f"    Utilities = {deal.expenses.landlord_paid_utilities_monthly:.2f} × {expense_growth:.4f} = {utilities:.2f}")
-            fixed_total = property_tax + insurance + hoa + utilities
-            logger.info(f"    ➡️  Fixed Total = {fixed_total:.2f}")
-            
-            logger.info(f"\n  📊 VARIABLE EXPENSES (% of Annual EGI):")
-            logger.info(f"    Maintenance = ({annual_egi:.2f} × {deal.expenses.maintenance_percent}%) / 12 = {maintenance:.2f}")
-            logger.info(f"    Property Mgmt = ({annual_egi:.2f} × {deal.expenses.property_management_percent}%) / 12 = {property_management:.2f}")
-            variable_total = maintenance + property_management
-            logger.info(f"    ➡️  Variable Total = {variable_total:.2f}")
-            
-            if other_expenses > 0:
-                logger.info(f"\n  📝 OTHER EXPENSES:")
-                for expense in deal.expenses.other_expenses:
-                    annual_exp = expense.calculate_annual_expense(annual_egi, deal.property.num_units)
-                    monthly_exp = annual_exp / 12
-                    logger.info(f"    {expense.category.value}: {monthly_exp:.2f} (Annual: {annual_exp:.2f})")
-                logger.info(f"    ➡️  Other Total = {other_expenses:.2f}")
-            
-            logger.info(f"\n  💵 TOTAL MONTHLY OPEX:")
-            logger.info(f"    Fixed: {fixed_total:.2f}")
-            logger.info(f"    Variable: {variable_total:.2f}")
-            logger.info(f"    Other: {other_expenses:.2f}")
-            logger.info(f"    ➡️  TOTAL = {total_expenses:.2f}")
-            
-            opex_ratio = (total_expenses / effective_income * 100) if effective_income > 0 else 0
-            logger.info(f"    📈 OPEX Ratio = {total_expenses:.2f} / {effective_income:.2f} = {opex_ratio:.2f}%")
-            
-            # Cash Flow section
-            logger.info(f"\n💸 CASH FLOW:")
-            logger.info(f"  NOI = {effective_income:.2f} - {total_expenses:.2f} = {noi:.2f}")
-            logger.info(f"  Debt Service = {debt_service:.2f}")
-            logger.info(f"  Pre-Tax Cash Flow = {noi:.2f} - {debt_service:.2f} = {cash_flow:.2f}")
-            logger.info(f"{'='*80}\n")
-        
-        return MonthlyCashFlow(
+        # OPEX Logging - once per year, for January
+        logger.info(f"\n{'='*80}")
+        logger.info(f"OPEX BREAKDOWN - Year {year}, Month {month} | Deal: {deal.deal_id}")
+        logger.info(f"{'='*80}")
+        
+        # Income section
+        logger.info(f"\n📊 INCOME CALCULATION:")
+        logger.info(f"  Growth Factor = (1 + {deal.income.annual_rent_increase_percent}% / 100) ^ ({year} - 1) = {growth_factor:.4f}")
+        logger.info(f"  Gross Rent = ({deal.income.monthly_rent_per_unit:.2f} × {deal.property.num_units} units) × {growth_factor:.4f} = {gross_rent:.2f}")
+        logger.info(f"  Other Income = {other_income:.2f}")
+        logger.info(f"  Total Income = {gross_rent:.2f} + {other_income:.2f} = {total_income:.2f}")
+        logger.info(f"  Vacancy Loss = {total_income:.2f} × {deal.income.vacancy_rate_percent}% = {vacancy_loss:.2f}")
+        logger.info(f"  Effective Income = {total_income:.2f} - {vacancy_loss:.2f} = {effective_income:.2f}")
+        logger.info(f"  Annual EGI = {effective_income:.2f} × 12 = {annual_egi:.2f}")
+        
+        # OPEX section
+        logger.info(f"\n💰 OPEX CALCULATION:")
+        logger.info(f"  Expense Growth Factor = (1 + {deal.expenses.annual_expense_growth_percent}% / 100) ^ ({year} - 1) = {expense_growth:.4f}")
+        
+        logger.info(f"\n  📌 FIXED EXPENSES:")
+        logger.info(f"    Property Tax = ({deal.expenses.property_tax_annual:.2f} / 12) × {expense_growth:.4f} = {property_tax:.2f}")
+        logger.info(f"    Insurance = ({deal.expenses.insurance_annual:.2f} / 12) × {expense_growth:.4f} = {insurance:.2f}")
+        logger.info(f"    HOA = {deal.expenses.hoa_monthly:.2f} × {expense_growth:.4f} = {hoa:.2f}")
+        logger.info(f"    Utilities = {deal.expenses.landlord_paid_utilities_monthly:.2f} × {expense_growth:.4f} = {utilities:.2f}")
+        fixed_total = property_tax + insurance + hoa + utilities
+        logger.info(f"    ➡️  Fixed Total = {fixed_total:.2f}")
+        
+        logger.info(f"\n  📊 VARIABLE EXPENSES (% of Annual EGI):")
+        logger.info(f"    Maintenance = ({annual_egi:.2f} × {deal.expenses.maintenance_percent}%) / 12 = {maintenance:.2f}")
+        logger.info(f"    Property Mgmt = ({annual_egi:.2f} × {deal.expenses.property_management_percent}%) / 12 = {property_management:.2f}")
+        variable_total = maintenance + property_management
+        logger.info(f"    ➡️  Variable Total = {variable_total:.2f}")
+        
+        if other_expenses > 0:
+            logger.info(f"\n  📝 OTHER EXPENSES:")
+            for expense in deal.expenses.other_expenses:
+                annual_exp = expense.calculate_annual_expense(annual_egi, deal.property.num_units)
+                monthly_exp = annual_exp / 12
+                logger.info(f"    {expense.category.value}: {monthly_exp:.2f} (Annual: {annual_exp:.2f})")
+            logger.info(f"    ➡️  Other Total = {other_expenses:.2f}")
+        
+        logger.info(f"\n  💵 TOTAL MONTHLY OPEX:")
+        logger.info(f"    Fixed: {fixed_total:.2f}")
+        logger.info(f"    Variable: {variable_total:.2f}")
+        logger.info(f"    Other: {other_expenses:.2f}")
+        logger.info(f"    ➡️  TOTAL = {total_expenses:.2f}")
+        
+        opex_ratio = (total_expenses / effective_income * 100) if effective_income > 0 else 0
+        logger.info(f"    📈 OPEX Ratio = {total_expenses:.2f} / {effective_income:.2f} = {opex_ratio:.2f}%")
+        
+        # Cash Flow section
+        logger.info(f"\n💸 CASH FLOW:")
+        logger.info(f"  NOI = {effective_income:.2f} - {total_expenses:.2f} = {noi:.2f}")
+        logger.info(f"  Debt Service = {debt_service:.2f}")
+        logger.info(f"  Pre-Tax Cash Flow = {noi:.2f} - {debt_service:.2f} = {cash_flow:.2f}")
+        logger.info(f"{'='*80}\n")
+
+        # Built from already-validated deal inputs, so validation is skipped;
+        # float() keeps the types the validator would have produced
+        return MonthlyCashFlow.model_construct(
             month=month,
             year=year,
-            gross_rent=gross_rent,
-            other_income=other_income,
-            vacancy_loss=vacancy_loss,
-            effective_income=effective_income,
-            property_tax=property_tax,
-            insurance=insurance,
-            hoa=hoa,
-            utilities=utilities,
-            maintenance=maintenance,
-            property_management=property_management,
-            other_expenses=other_expenses,
-            total_expenses=total_expenses,
-            net_operating_income=noi,
-            debt_service=debt_service,
-            pre_tax_cash_flow=cash_flow
+            gross_rent=float(gross_rent),
+            other_income=float(other_income),
+            vacancy_loss=float(vacancy_loss),
+            effective_income=float(effective_income),
+            property_tax=float(property_tax),
+            insurance=float(insurance),
+            hoa=float(hoa),
+            utilities=float(utilities),
+            maintenance=float(maintenance),
+            property_management=float(property_management),
+            other_expenses=float(other_expenses),
+            total_expenses=float(total_expenses),
+            net_operating_income=float(noi),
+            debt_service=float(debt_service),
+            pre_tax_cash_flow=float(cash_flow)
         )
     
-    def _find_positive_cash_flow_month(self, flows: List[MonthlyCashFlow]) -> int:
+    def _find_positive_cash_flow_month(self, cumulative_cash_flow: np.ndarray) -> int:
         """Find first month with positive cumulative cash flow."""
-        for i, flow in enumerate(flows):
-            if flow.cumulative_cash_flow > 0:
-                return i + 1
-        return -1  # Never positive 
\ No newline at end of file
+        positive = cumulative_cash_flow > 0
+        if not positive.any():
+            return -1  # Never positive
+        return int(positive.argmax()) + 1 
\ No newline at end of file
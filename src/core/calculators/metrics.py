@@ -1,12 +1,12 @@
 """Financial metrics calculator."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
-import numpy_financial as npf
 from pydantic import BaseModel, Field
 from loguru import logger
 
-from .base import Calculator, CalculatorResult
+from ._fast_finance import irr_newton, net_present_value
+from .base import Calculator, CalculatorResult, LRUCache
 from .proforma import ProFormaCalculator
 from ..models.metrics import MetricResult, MetricType
 
@@ -34,23 +34,30 @@ class MetricsBundle(BaseModel):
     
     def to_dict(self) -> Dict[str, float]:
         """Convert metrics to simple dictionary."""
-        result = {}
-        for field_name, field_value in self:
-            if isinstance(field_value, MetricResult):
-                result[field_name] = field_value.value
-        return result
+        return {name: metric.value for name, metric in self._calculated_metrics()}
     
     def get_all_metrics(self) -> List[MetricResult]:
         """Get all metrics as a list."""
-        metrics = []
-        for field_name, field_value in self:
-            if isinstance(field_value, MetricResult):
-                metrics.append(field_value)
-        return metrics
+        return [metric for _, metric in self._calculated_metrics()]
+
+    def _calculated_metrics(self) -> List[Tuple[str, MetricResult]]:
+        """(field name, metric) for each metric that was calculated, in field order."""
+        values = self.__dict__
+        return [
+            (name, values[name])
+            for name in type(self).model_fields
+            if values[name] is not None
+        ]
 
 
 class MetricsCalculator(Calculator):
     """Calculator for all financial metrics."""
+
+    # Year-1 metrics keyed by the deal's JSON (less its creation time),
+    # shared by all calculators; they do not depend on holding period or
+    # discount rate
+    BASIC_METRICS_CACHE_SIZE = 128
+    _basic_metrics_cache = LRUCache(BASIC_METRICS_CACHE_SIZE)
     
     def calculate(
         self, 
@@ -68,7 +75,7 @@ class MetricsCalculator(Calculator):
             )
         
         # Calculate basic metrics
-        basic_metrics = self._calculate_basic_metrics()
+        basic_metrics = self._cached_basic_metrics()
         
         # Calculate advanced metrics if holding period specified
         advanced_metrics = {}
@@ -93,6 +100,19 @@ class MetricsCalculator(Calculator):
             }
         )
     
+    def _cached_basic_metrics(self) -> Dict[str, MetricResult]:
+        """Basic metrics for the deal, reusing results for an identical deal.
+
+        Each call gets its own copies, so bundles never share a MetricResult.
+        """
+        cache = self._basic_metrics_cache
+        key = self.deal.model_dump_json(exclude={"created_date"})
+        metrics = cache.get(key)
+        if metrics is None:
+            metrics = self._calculate_basic_metrics()
+            cache.put(key, metrics)
+        return {name: metric.model_copy(deep=True) for name, metric in metrics.items()}
+
     def _calculate_basic_metrics(self) -> Dict[str, MetricResult]:
         """Calculate basic year 1 metrics."""
         deal = self.deal
@@ -136,10 +156,11 @@ class MetricsCalculator(Calculator):
         )
         
         # Break-even ratio
-        if deal.income.calculate_effective_gross_income(deal.property.num_units) > 0:
-            egi = deal.income.calculate_effective_gross_income(deal.property.num_units)
+        num_units = deal.property.num_units
+        egi = deal.income.calculate_effective_gross_income(num_units)
+        if egi > 0:
             total_expenses = (
-                deal.expenses.calculate_total_operating_expenses(egi, deal.property.num_units) +
+                deal.expenses.calculate_total_operating_expenses(egi, num_units) +
                 deal.financing.annual_debt_service
             )
             break_even = total_expenses / egi
@@ -179,13 +200,14 @@ class MetricsCalculator(Calculator):
             return {}
         
         proforma = proforma_result.data
-        df = proforma.to_dataframe()
+        # Per-year columns indexed by year (0..holding_period)
+        pre_tax_cash_flow = proforma.column('pre_tax_cash_flow')
+        roe = proforma.column('roe')
         
         # Calculate sale proceeds
-        final_year = df.iloc[-1]
-        sale_price = final_year['property_value']
+        sale_price = proforma.years[-1].property_value
         sales_costs = sale_price * (self.deal.market_assumptions.sales_expense_percent / 100)
-        loan_payoff = final_year['loan_balance']
+        loan_payoff = proforma.years[-1].loan_balance
         net_proceeds = sale_price - sales_costs - loan_payoff
         
         # IRR Calculation with detailed logging
@@ -200,8 +222,9 @@ class MetricsCalculator(Calculator):
         logger.info(f"  ➡️  Net Sale Proceeds = ${sale_price:,.2f} - ${sales_costs:,.2f} - ${loan_payoff:,.2f} = ${net_proceeds:,.2f}")
         
         # Build cash flows array
-        cash_flows = df['pre_tax_cash_flow'].tolist()
+        cash_flows = pre_tax_cash_flow.tolist()
         cash_flows[-1] += net_proceeds  # Add sale proceeds to final year
+        cash_flow_array = np.asarray(cash_flows, dtype=np.float64)  # shared by IRR and NPV
         
         logger.info(f"\n💵 CASH FLOWS FOR IRR CALCULATION:")
         logger.info(f"  IRR is the rate where NPV of all cash flows = 0")
@@ -236,9 +259,10 @@ class MetricsCalculator(Calculator):
         logger.info(f"    Net Cash Flow: ${net_cash:,.2f}")
         
         try:
-            irr = float(npf.irr(cash_flows))
+            with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+                irr = irr_newton(cash_flow_array)
             logger.info(f"\n🎯 IRR CALCULATION RESULT:")
-            logger.info(f"  Using numpy_financial.irr() function to solve for rate where NPV = 0")
+            logger.info(f"  Using Newton's method (numpy_financial.irr() fallback) to solve for rate where NPV = 0")
             logger.info(f"  ➡️  IRR = {irr*100:.2f}%")
             
             if irr > 0:
@@ -251,7 +275,7 @@ class MetricsCalculator(Calculator):
                 logger.info(f"\n  ⚠️  BREAKEVEN: The investment returns exactly the cost of capital")
             else:
                 logger.info(f"\n  ❌ NEGATIVE RETURN: The investment loses {abs(irr)*100:.2f}% annually")
-        except Exception as e:
+        except (ValueError, ArithmeticError) as e:
             irr = 0.0
             logger.info(f"\n  ⚠️  IRR CALCULATION ERROR: {str(e)}")
             logger.info(f"  This can happen when:")
@@ -265,8 +289,9 @@ class MetricsCalculator(Calculator):
         
         # NPV Calculation
         try:
-            npv = float(npf.npv(discount_rate, cash_flows))
-        except:
+            with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+                npv = net_present_value(discount_rate, cash_flow_array)
+        except (ValueError, ArithmeticError):
             npv = 0.0
             
         npv_metric = MetricResult(
@@ -294,8 +319,8 @@ class MetricsCalculator(Calculator):
         
         logger.info(f"\n💵 ANALYZING ANNUAL CASH FLOWS (Years 1-{holding_period}):")
         for year in range(1, holding_period + 1):
-            if year <= len(df):
-                cf = df.loc[year, 'pre_tax_cash_flow']
+            if year < len(pre_tax_cash_flow):
+                cf = pre_tax_cash_flow[year]
                 if cf >= 0:
                     logger.info(f"  Year {year}: +${cf:,.2f} (Distribution)")
                     positive_cash_flows += cf
@@ -350,16 +375,16 @@ class MetricsCalculator(Calculator):
         logger.info(f"{'='*90}")
         
         # Get Year 1 ROE from proforma
-        year_1_row = df.loc[1]
-        roe_year1_value = year_1_row['roe']
+        year_1 = proforma.years[1]
+        roe_year1_value = roe[1]
         
         logger.info(f"\n💵 YEAR 1 ROE:")
-        logger.info(f"  Year 1 Cash Flow = ${year_1_row['pre_tax_cash_flow']:,.2f}")
-        logger.info(f"  Year 1 Average Equity = ${year_1_row['average_equity']:,.2f}")
-        logger.info(f"  ➡️  Year 1 ROE = ${year_1_row['pre_tax_cash_flow']:,.2f} / ${year_1_row['average_equity']:,.2f} = {roe_year1_value:.2%}")
+        logger.info(f"  Year 1 Cash Flow = ${year_1.pre_tax_cash_flow:,.2f}")
+        logger.info(f"  Year 1 Average Equity = ${year_1.average_equity:,.2f}")
+        logger.info(f"  ➡️  Year 1 ROE = ${year_1.pre_tax_cash_flow:,.2f} / ${year_1.average_equity:,.2f} = {roe_year1_value:.2%}")
         
         # Calculate average ROE across all years
-        roe_values = df.loc[1:, 'roe']  # Exclude year 0
+        roe_values = roe[1:]  # Exclude year 0
         avg_roe_value = roe_values.mean()
         
         logger.info(f"\n📈 AVERAGE ROE (Years 1-{holding_period}):")
@@ -368,8 +393,8 @@ class MetricsCalculator(Calculator):
         # Show ROE trend
         logger.info(f"\n📊 ROE TREND OVER TIME:")
         for year in [1, 2, 3, 5, 10, holding_period]:
-            if year <= holding_period and year in df.index:
-                year_roe = df.loc[year, 'roe']
+            if year <= holding_period and year < len(roe):
+                year_roe = roe[year]
                 logger.info(f"    Year {year:2d}: {year_roe:>7.2%}")
         
         logger.info(f"\n💡 ROE INTERPRETATION:")
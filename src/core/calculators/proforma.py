@@ -1,12 +1,12 @@
 """Pro-forma financial projections calculator."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
 from pydantic import BaseModel, Field
 from loguru import logger
 
-from .base import Calculator, CalculatorResult
+from .base import Calculator, CalculatorResult, records_to_dataframe
 from .amortization import AmortizationCalculator
 
 
@@ -56,32 +56,43 @@ class ProForma(BaseModel):
     years: List[ProFormaYear]
     initial_investment: float
     
-    def to_dataframe(self) -> pd.DataFrame:
-        """Convert pro-forma to pandas DataFrame."""
-        data = []
-        for year in self.years:
-            year_dict = year.dict()
-            year_dict.pop('expense_breakdown')  # Remove nested dict
-            data.append(year_dict)
-        return pd.DataFrame(data).set_index('year')
+    def to_dataframe(self, float_dtype: Optional[np.dtype] = None) -> pd.DataFrame:
+        """Convert pro-forma to pandas DataFrame.
+
+        Args:
+            float_dtype: Dtype for the float columns, e.g. np.float32 to halve
+                the memory of bulk scenario frames. Defaults to float64.
+        """
+        # The nested expense_breakdown dict is left out
+        df = records_to_dataframe(self.years, exclude=("expense_breakdown",)).set_index('year')
+        if float_dtype is not None:
+            float_columns = df.select_dtypes(include="float").columns
+            df = df.astype({name: float_dtype for name in float_columns})
+        return df
+
+    def column(self, name: str) -> np.ndarray:
+        """One ProFormaYear field for every year (year 0 first) as a float array."""
+        return np.array([getattr(year, name) for year in self.years], dtype=float)
     
     def get_summary_metrics(self) -> Dict[str, float]:
         """Get summary metrics from the pro-forma."""
-        df = self.to_dataframe()
+        # Read straight from the column arrays; building the whole DataFrame
+        # for six numbers costs more than the numbers themselves
+        cash_flow = self.column('pre_tax_cash_flow')
         
         return {
-            'total_cash_flow': df['pre_tax_cash_flow'].sum(),
-            'average_noi': df['net_operating_income'].mean(),
-            'average_cash_flow': df['pre_tax_cash_flow'].mean(),
-            'total_principal_paid': df['cumulative_principal_paid'].iloc[-1] if len(df) > 0 else 0,
-            'ending_property_value': df['property_value'].iloc[-1] if len(df) > 0 else 0,
-            'ending_equity': df['total_equity'].iloc[-1] if len(df) > 0 else 0,
+            'total_cash_flow': cash_flow.sum(),
+            'average_noi': self.column('net_operating_income').mean(),
+            'average_cash_flow': cash_flow.mean(),
+            'total_principal_paid': self.column('cumulative_principal_paid')[-1] if self.years else 0,
+            'ending_property_value': self.column('property_value')[-1] if self.years else 0,
+            'ending_equity': self.column('total_equity')[-1] if self.years else 0,
         }
 
 
 class ProFormaCalculator(Calculator):
     """Calculator for multi-year financial projections."""
-    
+
     def calculate(self, years: int = 30, **kwargs) -> CalculatorResult[ProForma]:
         """Calculate pro-forma projections."""
         errors = self.validate_inputs()
@@ -93,18 +104,7 @@ class ProFormaCalculator(Calculator):
             )
         
         # Get amortization schedule if financed
-        amort_schedule = None
-        if not self.deal.financing.is_cash_purchase:
-            amort_calc = AmortizationCalculator(self.deal)
-            amort_result = amort_calc.calculate()
-            if amort_result.success:
-                amort_schedule = amort_result.data.get_yearly_summary()
-        
-        # Build pro-forma
-        proforma_years = []
-        cumulative_cash_flow = 0
-        cumulative_principal = 0
-        previous_equity = 0  # Track previous year's equity for ROE calculation
+        amort_schedule = self._yearly_amortization()
         
         # Year 0 - Initial Investment
         year_0 = ProFormaYear(
@@ -114,29 +114,45 @@ class ProFormaCalculator(Calculator):
             loan_balance=self.deal.financing.loan_amount,
             total_equity=self.deal.property.purchase_price - self.deal.financing.loan_amount,
         )
-        proforma_years.append(year_0)
-        previous_equity = year_0.total_equity
-        
-        # Years 1 through N
-        for year in range(1, years + 1):
-            year_data = self._calculate_year(
-                year, 
-                amort_schedule, 
-                cumulative_cash_flow,
-                cumulative_principal,
-                previous_equity
+        proforma_years = [year_0]
+
+        # Years 1 through N, projected as arrays and then split into years
+        projection = self._project_years(years, amort_schedule, year_0.total_equity)
+        num_units = self.deal.property.num_units
+        for i, year in enumerate(range(1, years + 1)):
+            row = {name: values[i] for name, values in projection.items()}
+            expense_breakdown = self.deal.expenses.get_expense_breakdown(
+                row["egi"], num_units, year=year
+            )
+            self._log_year(year, row, expense_breakdown)
+
+            # Every value is a float from the projection, so validation is skipped
+            year_data = ProFormaYear.model_construct(
+                year=year,
+                gross_potential_rent=row["gpr"],
+                other_income=row["other"],
+                vacancy_loss=row["vacancy_loss"],
+                effective_gross_income=row["egi"],
+                operating_expenses=row["opex"],
+                expense_breakdown={key: float(value) for key, value in expense_breakdown.items()},
+                net_operating_income=row["noi"],
+                debt_service=row["debt_service"],
+                pre_tax_cash_flow=row["cash_flow"],
+                principal_payment=row["principal"],
+                interest_payment=row["interest"],
+                loan_balance=row["loan_balance"],
+                property_value=row["property_value"],
+                total_equity=row["total_equity"],
+                equity_from_appreciation=row["equity_from_appreciation"],
+                equity_from_principal_paydown=row["equity_from_principal"],
+                average_equity=row["average_equity"],
+                roe=row["roe"],
+                cumulative_cash_flow=row["cumulative_cash_flow"],
             )
-            
-            # Update cumulative values
-            cumulative_cash_flow += year_data.pre_tax_cash_flow
-            year_data.cumulative_cash_flow = cumulative_cash_flow
-            
-            if year_data.principal_payment > 0:
-                cumulative_principal += year_data.principal_payment
-                year_data.cumulative_principal_paid = cumulative_principal
-            
+            # Only years that pay principal down record the running total
+            if row["principal"] > 0:
+                year_data.cumulative_principal_paid = row["cumulative_principal"]
             proforma_years.append(year_data)
-            previous_equity = year_data.total_equity
         
         proforma = ProForma(
             years=proforma_years,
@@ -147,75 +163,128 @@ class ProFormaCalculator(Calculator):
             success=True,
             data=proforma
         )
-    
-    def _calculate_year(
-        self, 
-        year: int, 
-        amort_schedule: pd.DataFrame,
-        cumulative_cash_flow: float,
-        cumulative_principal: float,
-        previous_equity: float
-    ) -> ProFormaYear:
-        """Calculate financials for a specific year."""
+
+    def _yearly_amortization(self) -> Optional[Dict[str, np.ndarray]]:
+        """Yearly amortization summary columns (read-only), or None if unfinanced."""
+        if self.deal.financing.is_cash_purchase:
+            return None
+        return AmortizationCalculator(self.deal).calculate_yearly_columns()
+
+    def _project_years(
+        self,
+        years: int,
+        amort_schedule: Optional[Dict[str, np.ndarray]],
+        initial_equity: float,
+    ) -> Dict[str, List[float]]:
+        """Project years 1..N as arrays, one list of floats per quantity.
+
+        Growth factors use the same scalar powers as the per-year formulas
+        and the running totals are sequential cumsums, so every value equals
+        its one-year-at-a-time counterpart.
+        """
+        deal = self.deal
+        income = deal.income
+        expenses = deal.expenses
+        num_units = deal.property.num_units
+        purchase_price = deal.property.purchase_price
+        year_numbers = range(1, years + 1)
+
         # Income projections
-        income = self.deal.income
-        num_units = self.deal.property.num_units
-        
-        # Calculate base income with growth
-        if year == 1:
-            gpr = income.calculate_gross_potential_rent(num_units)
-            other = income.calculate_other_income_annual(num_units)
-            income_growth_factor = 1.0
-        else:
-            income_growth_factor = (1 + income.annual_rent_increase_percent / 100) ** (year - 1)
-            gpr = income.calculate_gross_potential_rent(num_units) * income_growth_factor
-            other = income.calculate_other_income_annual(num_units) * income_growth_factor
-        
+        rent_growth = 1 + income.annual_rent_increase_percent / 100
+        income_growth_factor = np.array([rent_growth ** (year - 1) for year in year_numbers])
+        gpr = income.calculate_gross_potential_rent(num_units) * income_growth_factor
+        other = income.calculate_other_income_annual(num_units) * income_growth_factor
         total_potential = gpr + other
         vacancy_loss = total_potential * (income.vacancy_rate_percent / 100)
         egi = total_potential - vacancy_loss
-        
+
         # Expense projections
-        expenses = self.deal.expenses
-        if year == 1:
-            opex = expenses.calculate_total_operating_expenses(egi, num_units)
-            expense_breakdown = expenses.get_expense_breakdown(egi, num_units, year=1)
-            expense_growth_factor = 1.0
-        else:
-            expense_growth_factor = (1 + expenses.annual_expense_growth_percent / 100) ** (year - 1)
-            # Use project_expenses which correctly applies growth only to fixed expenses
-            opex = expenses.project_expenses(year, egi, num_units)
-            # Get expense breakdown with year parameter for proper growth calculation
-            expense_breakdown = expenses.get_expense_breakdown(egi, num_units, year=year)
-        
-        # NOI
+        expense_growth = 1 + expenses.annual_expense_growth_percent / 100
+        expense_growth_factor = np.array([expense_growth ** (year - 1) for year in year_numbers])
+        opex = np.array(
+            [
+                expenses.project_expenses(year, value, num_units)
+                for year, value in zip(year_numbers, egi.tolist())
+            ],
+            dtype=float,
+        )
         noi = egi - opex
-        
-        # Debt service and loan details
-        if amort_schedule is not None and year <= len(amort_schedule):
-            year_amort = amort_schedule.iloc[year - 1]
-            debt_service = year_amort['payment_amount']
-            principal = year_amort['principal_payment']
-            interest = year_amort['interest_payment']
-            loan_balance = year_amort['ending_balance']
-        else:
-            debt_service = 0
-            principal = 0
-            interest = 0
-            loan_balance = 0
-        
-        # Cash flow
+
+        # Debt service and loan details (zero once the schedule has ended)
+        debt_service = np.zeros(years)
+        principal = np.zeros(years)
+        interest = np.zeros(years)
+        loan_balance = np.zeros(years)
+        if amort_schedule is not None:
+            n = min(years, len(amort_schedule['payment_amount']))
+            debt_service[:n] = amort_schedule['payment_amount'][:n]
+            principal[:n] = amort_schedule['principal_payment'][:n]
+            interest[:n] = amort_schedule['interest_payment'][:n]
+            loan_balance[:n] = amort_schedule['ending_balance'][:n]
+
         cash_flow = noi - debt_service
-        
+        cumulative_cash_flow = np.cumsum(cash_flow)
+        cumulative_principal = np.cumsum(np.where(principal > 0, principal, 0.0))
+
         # Property value with appreciation
-        appreciation_rate = self.deal.market_assumptions.annual_appreciation_percent / 100
-        property_value = self.deal.property.purchase_price * ((1 + appreciation_rate) ** year)
-        
-        # Equity calculation
+        appreciation = 1 + deal.market_assumptions.annual_appreciation_percent / 100
+        property_value = purchase_price * np.array([appreciation ** year for year in year_numbers])
+
+        # Equity and ROE (average of the previous and current year's equity)
         total_equity = property_value - loan_balance
-        equity_from_appreciation = property_value - self.deal.property.purchase_price
-        equity_from_principal = cumulative_principal + principal
-        
+        equity_from_appreciation = property_value - purchase_price
+        equity_from_principal = np.concatenate(([0.0], cumulative_principal[:-1])) + principal
+        previous_equity = np.concatenate(([initial_equity], total_equity[:-1]))
+        average_equity = (previous_equity + total_equity) / 2
+        roe = np.divide(
+            cash_flow, average_equity, out=np.zeros(years), where=average_equity > 0
+        )
+
+        arrays = {
+            "income_growth_factor": income_growth_factor,
+            "gpr": gpr,
+            "other": other,
+            "total_potential": total_potential,
+            "vacancy_loss": vacancy_loss,
+            "egi": egi,
+            "expense_growth_factor": expense_growth_factor,
+            "opex": opex,
+            "noi": noi,
+            "debt_service": debt_service,
+            "principal": principal,
+            "interest": interest,
+            "loan_balance": loan_balance,
+            "cash_flow": cash_flow,
+            "cumulative_cash_flow": cumulative_cash_flow,
+            "cumulative_principal": cumulative_principal,
+            "property_value": property_value,
+            "total_equity": total_equity,
+            "equity_from_appreciation": equity_from_appreciation,
+            "equity_from_principal": equity_from_principal,
+            "previous_equity": previous_equity,
+            "average_equity": average_equity,
+            "roe": roe,
+        }
+        return {name: values.tolist() for name, values in arrays.items()}
+
+    def _log_year(self, year: int, row: Dict[str, float], expense_breakdown: Dict[str, float]) -> None:
+        """Log the detailed pro-forma calculation for one year."""
+        income = self.deal.income
+        expenses = self.deal.expenses
+        num_units = self.deal.property.num_units
+        income_growth_factor = row["income_growth_factor"]
+        expense_growth_factor = row["expense_growth_factor"]
+        gpr, other = row["gpr"], row["other"]
+        total_potential, vacancy_loss, egi = row["total_potential"], row["vacancy_loss"], row["egi"]
+        opex, noi, cash_flow = row["opex"], row["noi"], row["cash_flow"]
+        debt_service, principal, interest = row["debt_service"], row["principal"], row["interest"]
+        loan_balance, property_value = row["loan_balance"], row["property_value"]
+        total_equity, previous_equity = row["total_equity"], row["previous_equity"]
+        equity_from_appreciation = row["equity_from_appreciation"]
+        equity_from_principal = row["equity_from_principal"]
+        average_equity, roe = row["average_equity"], row["roe"]
+        appreciation_rate = self.deal.market_assumptions.annual_appreciation_percent / 100
+
         # ANNUAL OPEX LOGGING - Log every year
         logger.info(f"\n{'='*90}")
         logger.info(f"📅 ANNUAL PRO-FORMA - YEAR {year} | Deal: {self.deal.deal_id}")
@@ -312,9 +381,6 @@ class ProFormaCalculator(Calculator):
         logger.info(f"    (Appreciation: {equity_from_appreciation:.2f}, Principal Paydown: {equity_from_principal:.2f})")
         
         # ROE Calculation
-        average_equity = (previous_equity + total_equity) / 2
-        roe = cash_flow / average_equity if average_equity > 0 else 0
-        
         logger.info(f"\n📊 RETURN ON EQUITY (ROE):")
         logger.info(f"  Previous Year Equity = {previous_equity:.2f}")
         logger.info(f"  Current Year Equity = {total_equity:.2f}")
@@ -330,25 +396,3 @@ class ProFormaCalculator(Calculator):
             logger.info(f"  ❌ Negative return: Equity is losing {abs(roe):.2%}")
         
         logger.info(f"{'='*90}\n")
-        
-        return ProFormaYear(
-            year=year,
-            gross_potential_rent=gpr,
-            other_income=other,
-            vacancy_loss=vacancy_loss,
-            effective_gross_income=egi,
-            operating_expenses=opex,
-            expense_breakdown=expense_breakdown,
-            net_operating_income=noi,
-            debt_service=debt_service,
-            pre_tax_cash_flow=cash_flow,
-            principal_payment=principal,
-            interest_payment=interest,
-            loan_balance=loan_balance,
-            property_value=property_value,
-            total_equity=total_equity,
-            equity_from_appreciation=equity_from_appreciation,
-            equity_from_principal_paydown=equity_from_principal,
-            average_equity=average_equity,
-            roe=roe,
-        ) 
\ No newline at end of file